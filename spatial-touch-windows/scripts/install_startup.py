@@ -18,42 +18,153 @@ REGISTRY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 def get_exe_path() -> str:
     """Get path to the executable."""
     # Check common locations
+    # Onedir layout (the build default) first, then the legacy
+    # onefile artifact and an installed copy next to the interpreter
     possible_paths = [
+        Path(__file__).parent.parent / "dist" / "SpatialTouch" / "SpatialTouch.exe",
         Path(__file__).parent.parent / "dist" / "SpatialTouch.exe",
         Path(sys.executable).parent / "SpatialTouch.exe",
+        Path.cwd() / "dist" / "SpatialTouch" / "SpatialTouch.exe",
         Path.cwd() / "dist" / "SpatialTouch.exe",
     ]
-    
+
+    # One scandir per unique parent instead of a stat per candidate;
+    # directory entries come back with cached file metadata
+    found = {}
+    for parent in {path.parent for path in possible_paths}:
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name == "SpatialTouch.exe" and entry.is_file():
+                        found[parent] = Path(entry.path)
+        except OSError:
+            continue
+
     for path in possible_paths:
-        if path.exists():
-            return str(path.absolute())
-    
+        if path.parent in found:
+            return str(found[path.parent].absolute())
+
     return None
 
 
 def add_to_startup(exe_path: str) -> bool:
     """Add application to Windows startup.
-    
+
     Args:
         exe_path: Path to the executable
-        
+
+    Returns:
+        True if successful
+    """
+    return add_startup_entries({APP_NAME: exe_path})
+
+
+def add_startup_entries(entries: dict) -> bool:
+    """Write startup entries in one batched registry update.
+
+    Uses a kernel registry transaction so all values become visible
+    atomically and the key is opened and flushed once instead of once
+    per value. Falls back to plain writes if transactions are
+    unavailable.
+
+    Args:
+        entries: Mapping of value name to executable path
+
     Returns:
         True if successful
     """
     try:
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
+        _write_entries_transacted(entries)
+    except OSError:
+        try:
+            key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                REGISTRY_PATH,
+                0,
+                winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
+            )
+            for name, path in entries.items():
+                winreg.SetValueEx(key, name, 0, winreg.REG_SZ, path)
+            winreg.CloseKey(key)
+        except WindowsError as e:
+            print(f"❌ Failed to add to startup: {e}")
+            return False
+
+    for name, path in entries.items():
+        print(f"✅ Added to startup: {name} -> {path}")
+    return True
+
+
+def _write_entries_transacted(entries: dict) -> None:
+    """Write registry values inside a single kernel transaction.
+
+    Args:
+        entries: Mapping of value name to executable path
+
+    Raises:
+        OSError: If the transacted update could not be completed
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    ktmw32 = ctypes.windll.ktmw32
+    advapi32 = ctypes.windll.advapi32
+    kernel32 = ctypes.windll.kernel32
+
+    # Without explicit prototypes ctypes treats return values and
+    # arguments as 32-bit ints, truncating 64-bit handles
+    ktmw32.CreateTransaction.restype = wintypes.HANDLE
+    ktmw32.CreateTransaction.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD,
+        wintypes.DWORD, wintypes.DWORD, wintypes.LPWSTR,
+    ]
+    ktmw32.CommitTransaction.restype = wintypes.BOOL
+    ktmw32.CommitTransaction.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    advapi32.RegCreateKeyTransactedW.restype = wintypes.LONG
+    advapi32.RegCreateKeyTransactedW.argtypes = [
+        wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPWSTR,
+        wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+        ctypes.POINTER(wintypes.HKEY), ctypes.POINTER(wintypes.DWORD),
+        wintypes.HANDLE, ctypes.c_void_p,
+    ]
+
+    invalid_handle = wintypes.HANDLE(-1).value
+    transaction = ktmw32.CreateTransaction(
+        None, None, 0, 0, 0, 0, "SpatialTouch startup update"
+    )
+    if transaction == invalid_handle:
+        raise OSError("CreateTransaction failed")
+
+    try:
+        hkey = wintypes.HKEY()
+        result = advapi32.RegCreateKeyTransactedW(
+            wintypes.HKEY(winreg.HKEY_CURRENT_USER & 0xFFFFFFFF),
             REGISTRY_PATH,
             0,
-            winreg.KEY_SET_VALUE
+            None,
+            0,
+            winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY,
+            None,
+            ctypes.byref(hkey),
+            None,
+            transaction,
+            None
         )
-        winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
-        winreg.CloseKey(key)
-        print(f"✅ Added to startup: {exe_path}")
-        return True
-    except WindowsError as e:
-        print(f"❌ Failed to add to startup: {e}")
-        return False
+        if result != 0:
+            raise OSError(f"RegCreateKeyTransactedW failed: {result}")
+
+        try:
+            for name, path in entries.items():
+                winreg.SetValueEx(hkey.value, name, 0, winreg.REG_SZ, path)
+        finally:
+            advapi32.RegCloseKey(hkey)
+
+        if not ktmw32.CommitTransaction(transaction):
+            raise OSError("CommitTransaction failed")
+    finally:
+        kernel32.CloseHandle(transaction)
 
 
 def remove_from_startup() -> bool:
@@ -67,7 +178,7 @@ def remove_from_startup() -> bool:
             winreg.HKEY_CURRENT_USER,
             REGISTRY_PATH,
             0,
-            winreg.KEY_SET_VALUE
+            winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
         )
         winreg.DeleteValue(key, APP_NAME)
         winreg.CloseKey(key)
@@ -89,7 +200,7 @@ def check_startup_status() -> bool:
             winreg.HKEY_CURRENT_USER,
             REGISTRY_PATH,
             0,
-            winreg.KEY_READ
+            winreg.KEY_QUERY_VALUE | winreg.KEY_WOW64_64KEY
         )
         value, _ = winreg.QueryValueEx(key, APP_NAME)
         winreg.CloseKey(key)
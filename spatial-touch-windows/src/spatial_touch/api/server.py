@@ -8,20 +8,61 @@ Built with FastAPI for high performance and automatic OpenAPI documentation.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import mmap
+import os
+import sys
 import threading
-import json
+import time
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
 import logging
 
+import orjson
+
+# Hoisted so the first camera endpoint hit doesn't pay cv2's ~500 ms
+# initialization on a request worker thread
+try:
+    import cv2
+except ImportError:  # pragma: no cover - camera endpoints degrade
+    cv2 = None
+
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 import uvicorn
 
 logger = logging.getLogger(__name__)
 
+# How long cached camera probe results stay fresh (seconds)
+CAMERA_PROBE_TTL = 2.0
+
+# Full device enumeration is far costlier than a single probe, and the
+# UI polls it on a timer — let it stay fresh longer
+CAMERA_LIST_TTL = 5.0
+
+# How often the background pump refreshes the status snapshot (seconds)
+STATUS_PUMP_INTERVAL = 0.2
+
+# Clients per concurrent broadcast batch before yielding to the loop
+BROADCAST_BATCH_SIZE = 50
+
+# Capability table offered for any camera whose native mode covers them
+STANDARD_RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+
+# KSCATEGORY_VIDEO device-interface class; its registered instances
+# change whenever a camera is plugged or removed, making the subkey
+# list a cheap hot-plug signature
+_VIDEO_DEVICE_CLASS_KEY = (
+    r"SYSTEM\CurrentControlSet\Control\DeviceClasses"
+    r"\{6994ad05-93ef-11d0-a3cc-00a0c9223196}"
+)
+
 
 # ============================================================================
 # Pydantic Models for API
@@ -29,6 +70,8 @@ logger = logging.getLogger(__name__)
 
 class CameraSettings(BaseModel):
     """Camera configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     device_index: int = Field(0, ge=0, description="Camera device index")
     resolution: List[int] = Field([1280, 720], description="Resolution [width, height]")
     fps: int = Field(30, ge=1, le=120, description="Frames per second")
@@ -39,6 +82,8 @@ class CameraSettings(BaseModel):
 
 class TrackingSettings(BaseModel):
     """Hand tracking configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     max_hands: int = Field(1, ge=1, le=2, description="Maximum hands to track")
     min_detection_confidence: float = Field(0.7, ge=0.1, le=1.0, description="Detection confidence threshold")
     min_tracking_confidence: float = Field(0.5, ge=0.1, le=1.0, description="Tracking confidence threshold")
@@ -48,6 +93,8 @@ class TrackingSettings(BaseModel):
 
 class GestureSettings(BaseModel):
     """Gesture detection configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     pinch_threshold: float = Field(0.05, ge=0.01, le=0.2, description="Pinch detection threshold")
     debounce_ms: int = Field(200, ge=50, le=1000, description="Debounce time in milliseconds")
     hold_time_ms: int = Field(300, ge=100, le=2000, description="Hold time for long press")
@@ -57,6 +104,8 @@ class GestureSettings(BaseModel):
 
 class CursorSettings(BaseModel):
     """Cursor/zone mapping configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     sensitivity: float = Field(1.0, ge=0.1, le=5.0, description="Cursor sensitivity multiplier")
     dead_zone: float = Field(0.02, ge=0.0, le=0.2, description="Dead zone radius")
     invert_x: bool = Field(True, description="Invert X axis (mirror mode)")
@@ -67,6 +116,8 @@ class CursorSettings(BaseModel):
 
 class ActionSettings(BaseModel):
     """Action dispatcher configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     enable_mouse: bool = Field(True, description="Enable mouse control")
     enable_keyboard: bool = Field(True, description="Enable keyboard shortcuts")
     move_duration: float = Field(0.0, ge=0.0, le=1.0, description="Mouse movement duration")
@@ -77,6 +128,8 @@ class ActionSettings(BaseModel):
 
 class SystemSettings(BaseModel):
     """System configuration model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     log_level: str = Field("INFO", description="Logging level")
     debug_mode: bool = Field(False, description="Enable debug mode")
     idle_fps: int = Field(5, ge=1, le=30, description="FPS when idle")
@@ -87,6 +140,8 @@ class SystemSettings(BaseModel):
 
 class AllSettings(BaseModel):
     """Complete application settings."""
+    model_config = ConfigDict(extra="forbid")
+
     camera: CameraSettings = Field(default_factory=CameraSettings)
     tracking: TrackingSettings = Field(default_factory=TrackingSettings)
     gestures: GestureSettings = Field(default_factory=GestureSettings)
@@ -97,12 +152,30 @@ class AllSettings(BaseModel):
 
 class GestureBinding(BaseModel):
     """Custom gesture binding model."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     gesture: str = Field(..., description="Gesture name (pinch, double_tap, swipe_left, etc.)")
     action: str = Field(..., description="Action type (key, mouse, command)")
-    value: str = Field(..., description="Action value (key combo, mouse action, command)")
+    value: Union[str, List[Any], Dict[str, Any]] = Field(
+        ..., description="Action value (key combo, mouse action, command)"
+    )
     enabled: bool = Field(True, description="Whether binding is enabled")
 
 
+# Settings sections addressable via GET /api/settings/{section}
+SECTION_MODELS = {
+    "camera": CameraSettings,
+    "tracking": TrackingSettings,
+    "gestures": GestureSettings,
+    "cursor": CursorSettings,
+    "actions": ActionSettings,
+    "system": SystemSettings,
+}
+
+# One compiled validator for the whole bindings list instead of a
+# per-item model construction on every PUT
+BINDINGS_ADAPTER = TypeAdapter(List[GestureBinding])
+
 class CameraInfo(BaseModel):
     """Camera device information."""
     index: int
@@ -122,6 +195,17 @@ class AppStatus(BaseModel):
     gestures_detected: int
 
 
+# Warm the pydantic-core validators/serializers at import time so the
+# first request doesn't pay the lazy schema-compilation cost
+for _model in (CameraSettings, TrackingSettings, GestureSettings,
+               CursorSettings, ActionSettings, SystemSettings,
+               AllSettings, GestureBinding, CameraInfo, AppStatus):
+    _model.model_rebuild()
+    _model.__pydantic_validator__
+    _model.__pydantic_serializer__
+BINDINGS_ADAPTER.validate_python([])
+
+
 # ============================================================================
 # API Server
 # ============================================================================
@@ -140,7 +224,8 @@ def create_api_app(controller=None) -> FastAPI:
         description="REST API for controlling Spatial Touch hand gesture application",
         version="0.1.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse
     )
     
     # Add CORS middleware for Flutter app
@@ -157,8 +242,120 @@ def create_api_app(controller=None) -> FastAPI:
     app.state.config_path = None
     app.state.gestures_path = None
     
-    # WebSocket connections for real-time updates
-    app.state.ws_connections: List[WebSocket] = []
+    # WebSocket connections for real-time updates (set: O(1) add/discard)
+    app.state.ws_connections: set[WebSocket] = set()
+
+    # Parsed settings cache, invalidated when the file mtime changes
+    app.state.settings_cache = None
+    app.state.settings_mtime = 0
+
+    # Parsed gestures document, kept so saves don't re-read the file
+    # just to preserve its non-gesture sections
+    app.state.gestures_doc = None
+
+    # Camera probe results cached per-index with a short TTL
+    app.state.cam_probe_cache: Dict[int, tuple] = {}
+    app.state.cam_list_cache = None
+
+    # Latest status snapshot, refreshed by the background pump so GET
+    # /api/status is a cache read instead of an attribute walk
+    app.state.last_status = AppStatus(
+        running=False,
+        paused=False,
+        tracking_active=False,
+        camera_connected=False,
+        fps_actual=0.0,
+        frame_count=0,
+        gestures_detected=0,
+    )
+
+    async def _drain_broadcasts() -> None:
+        """Fan out queued events, coalescing bursts into one frame."""
+        broadcast_queue = app.state.broadcast_queue
+        while True:
+            items = [await broadcast_queue.get()]
+            while not broadcast_queue.empty():
+                items.append(broadcast_queue.get_nowait())
+            if len(items) == 1:
+                event, data = items[0]
+                await _broadcast_update(app, event, data)
+            else:
+                await _broadcast_update(app, "batch", [
+                    {"event": event, "data": data} for event, data in items
+                ])
+
+    async def _status_pump() -> None:
+        """Refresh the status snapshot and push changes to WS clients."""
+        while True:
+            controller = app.state.controller
+            if controller:
+                status = AppStatus(**controller.status_snapshot)
+                if status != app.state.last_status:
+                    app.state.last_status = status
+                    await _broadcast_update(app, "status", status.model_dump())
+            await asyncio.sleep(STATUS_PUMP_INTERVAL)
+
+    def _on_controller_gesture(gesture) -> None:
+        # Runs on the controller's dispatch thread. Snapshot the
+        # pooled Gesture before it crosses threads — the engine
+        # rewrites the instance on the next frame — then hand the
+        # event to the serving loop; the drain task coalesces rapid
+        # gesture bursts into one batch frame
+        queue_broadcast(app, "gesture", {
+            "type": gesture.type.name.lower(),
+            "position": list(gesture.position),
+            "confidence": gesture.confidence,
+            "timestamp": gesture.timestamp,
+        })
+
+    @app.on_event("startup")
+    async def _start_background_tasks():
+        # Created here so the queue binds to the serving event loop
+        app.state.event_loop = asyncio.get_running_loop()
+        app.state.broadcast_queue = asyncio.Queue()
+        app.state.broadcaster_task = asyncio.create_task(_drain_broadcasts())
+        app.state.status_pump_task = asyncio.create_task(_status_pump())
+
+        # Gesture telemetry: the controller thread produces through
+        # the queue rather than touching the event loop directly
+        if app.state.controller is not None:
+            app.state.controller.on_gesture(_on_controller_gesture)
+
+    @app.on_event("shutdown")
+    async def _stop_background_tasks():
+        app.state.status_pump_task.cancel()
+        app.state.broadcaster_task.cancel()
+
+    # Persistent worker that owns the blocking controller loop, so
+    # /api/control/start doesn't spawn a fresh thread per request
+    app.state.controller_commands = queue.Queue()
+    app.state.controller_ready = threading.Event()
+
+    def _controller_worker() -> None:
+        while True:
+            command = app.state.controller_commands.get()
+            controller = app.state.controller
+            if command == "start" and controller and not controller.is_running:
+                # One failed start (bad camera, etc.) must not kill
+                # the worker: the endpoint reports the 500 and the
+                # next command still has a consumer
+                try:
+                    controller.start(blocking=False)
+                except Exception as e:
+                    logger.error("Controller start failed: %s", e)
+                finally:
+                    app.state.controller_ready.set()
+                if controller.is_running:
+                    try:
+                        controller.run()
+                    except Exception as e:
+                        logger.error("Controller loop crashed: %s", e)
+
+    threading.Thread(
+        target=_controller_worker,
+        name="ControllerWorker",
+        daemon=True
+    ).start()
     
     # ========================================================================
     # Settings Endpoints
@@ -169,19 +366,32 @@ def create_api_app(controller=None) -> FastAPI:
         """Get all application settings."""
         try:
             config_path = app.state.config_path or _get_default_config_path()
-            settings = _load_settings(config_path)
-            return AllSettings(**settings)
+            mtime = _settings_mtime(config_path)
+
+            # Serve from cache while the file is unchanged; the Flutter
+            # client polls these endpoints, so re-parsing per GET adds up
+            if app.state.settings_cache is not None and mtime == app.state.settings_mtime:
+                return app.state.settings_cache
+
+            settings = AllSettings(**_load_settings(config_path))
+            app.state.settings_cache = settings
+            app.state.settings_mtime = mtime
+            return settings
         except Exception as e:
             logger.error("Failed to load settings: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
-    
+
     @app.put("/api/settings", response_model=AllSettings, tags=["Settings"])
     async def update_all_settings(settings: AllSettings):
         """Update all application settings."""
         try:
             config_path = app.state.config_path or _get_default_config_path()
             _save_settings(config_path, settings.model_dump())
-            
+
+            # Write through the cache so subsequent GETs skip the re-parse
+            app.state.settings_cache = settings
+            app.state.settings_mtime = _settings_mtime(config_path)
+
             # Notify WebSocket clients
             await _broadcast_update(app, "settings_updated", settings.model_dump())
             
@@ -193,89 +403,69 @@ def create_api_app(controller=None) -> FastAPI:
         except Exception as e:
             logger.error("Failed to save settings: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
-    
-    @app.get("/api/settings/camera", response_model=CameraSettings, tags=["Settings"])
-    async def get_camera_settings():
-        """Get camera settings."""
+
+    @app.get("/api/settings/{section}", tags=["Settings"])
+    async def get_settings_section(section: str):
+        """Get a single settings section.
+
+        Serves camera/tracking/gestures/cursor/actions/system from the
+        cached AllSettings instance without re-validating the full doc.
+        """
+        if section not in SECTION_MODELS:
+            raise HTTPException(status_code=404, detail=f"Unknown settings section: {section}")
         settings = await get_all_settings()
-        return settings.camera
+        return getattr(settings, section)
     
+    async def _update_section(section: str, value) -> None:
+        """Assign one section on the cached settings and persist once.
+
+        Skips the PUT-through-GET round trip: a single field assignment,
+        one atomic file rewrite, and one broadcast.
+        """
+        config_path = app.state.config_path or _get_default_config_path()
+        settings = await get_all_settings()
+        setattr(settings, section, value)
+        _save_settings(config_path, settings.model_dump())
+        app.state.settings_cache = settings
+        app.state.settings_mtime = _settings_mtime(config_path)
+        await _broadcast_update(app, "settings_updated", settings.model_dump())
+        if app.state.controller and app.state.controller.is_running:
+            await _reload_controller_config(app.state.controller, settings)
+
     @app.put("/api/settings/camera", response_model=CameraSettings, tags=["Settings"])
     async def update_camera_settings(camera: CameraSettings):
         """Update camera settings."""
-        settings = await get_all_settings()
-        settings.camera = camera
-        await update_all_settings(settings)
+        await _update_section("camera", camera)
         return camera
     
-    @app.get("/api/settings/tracking", response_model=TrackingSettings, tags=["Settings"])
-    async def get_tracking_settings():
-        """Get tracking settings."""
-        settings = await get_all_settings()
-        return settings.tracking
-    
     @app.put("/api/settings/tracking", response_model=TrackingSettings, tags=["Settings"])
     async def update_tracking_settings(tracking: TrackingSettings):
         """Update tracking settings."""
-        settings = await get_all_settings()
-        settings.tracking = tracking
-        await update_all_settings(settings)
+        await _update_section("tracking", tracking)
         return tracking
     
-    @app.get("/api/settings/gestures", response_model=GestureSettings, tags=["Settings"])
-    async def get_gesture_settings():
-        """Get gesture detection settings."""
-        settings = await get_all_settings()
-        return settings.gestures
-    
     @app.put("/api/settings/gestures", response_model=GestureSettings, tags=["Settings"])
     async def update_gesture_settings(gestures: GestureSettings):
         """Update gesture detection settings."""
-        settings = await get_all_settings()
-        settings.gestures = gestures
-        await update_all_settings(settings)
+        await _update_section("gestures", gestures)
         return gestures
     
-    @app.get("/api/settings/cursor", response_model=CursorSettings, tags=["Settings"])
-    async def get_cursor_settings():
-        """Get cursor settings."""
-        settings = await get_all_settings()
-        return settings.cursor
-    
     @app.put("/api/settings/cursor", response_model=CursorSettings, tags=["Settings"])
     async def update_cursor_settings(cursor: CursorSettings):
         """Update cursor settings."""
-        settings = await get_all_settings()
-        settings.cursor = cursor
-        await update_all_settings(settings)
+        await _update_section("cursor", cursor)
         return cursor
     
-    @app.get("/api/settings/actions", response_model=ActionSettings, tags=["Settings"])
-    async def get_action_settings():
-        """Get action dispatcher settings."""
-        settings = await get_all_settings()
-        return settings.actions
-    
     @app.put("/api/settings/actions", response_model=ActionSettings, tags=["Settings"])
     async def update_action_settings(actions: ActionSettings):
         """Update action dispatcher settings."""
-        settings = await get_all_settings()
-        settings.actions = actions
-        await update_all_settings(settings)
+        await _update_section("actions", actions)
         return actions
     
-    @app.get("/api/settings/system", response_model=SystemSettings, tags=["Settings"])
-    async def get_system_settings():
-        """Get system settings."""
-        settings = await get_all_settings()
-        return settings.system
-    
     @app.put("/api/settings/system", response_model=SystemSettings, tags=["Settings"])
     async def update_system_settings(system: SystemSettings):
         """Update system settings."""
-        settings = await get_all_settings()
-        settings.system = system
-        await update_all_settings(settings)
+        await _update_section("system", system)
         return system
     
     # ========================================================================
@@ -298,8 +488,10 @@ def create_api_app(controller=None) -> FastAPI:
         """Update all gesture bindings."""
         try:
             gestures_path = app.state.gestures_path or _get_default_gestures_path()
-            _save_gesture_bindings(gestures_path, bindings)
-            await _broadcast_update(app, "bindings_updated", [b.model_dump() for b in bindings])
+            app.state.gestures_doc = _save_gesture_bindings(
+                gestures_path, bindings, app.state.gestures_doc
+            )
+            await _broadcast_update(app, "bindings_updated", BINDINGS_ADAPTER.dump_python(bindings))
             return bindings
         except Exception as e:
             logger.error("Failed to save bindings: %s", e)
@@ -329,7 +521,20 @@ def create_api_app(controller=None) -> FastAPI:
     async def list_cameras():
         """List available cameras."""
         try:
-            cameras = _enumerate_cameras()
+            # Enumeration opens every device; cache it and run it in a
+            # worker thread so the event loop keeps serving requests
+            cached = app.state.cam_list_cache
+            if cached and time.monotonic() - cached[0] < CAMERA_LIST_TTL:
+                return cached[1]
+
+            cache_path = (
+                app.state.config_path or _get_default_config_path()
+            ).parent / "camera_cache.json"
+            loop = asyncio.get_running_loop()
+            cameras = await loop.run_in_executor(
+                None, _enumerate_cameras_cached, cache_path
+            )
+            app.state.cam_list_cache = (time.monotonic(), cameras)
             return cameras
         except Exception as e:
             logger.error("Failed to enumerate cameras: %s", e)
@@ -339,7 +544,7 @@ def create_api_app(controller=None) -> FastAPI:
     async def select_camera(index: int):
         """Select a camera by index."""
         settings = await get_all_settings()
-        settings.camera.device_index = index
+        settings.camera = settings.camera.model_copy(update={"device_index": index})
         await update_all_settings(settings)
         return {"status": "selected", "index": index}
     
@@ -347,13 +552,15 @@ def create_api_app(controller=None) -> FastAPI:
     async def test_camera(index: int):
         """Test if a camera is accessible."""
         try:
-            import cv2
-            cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
-            success = cap.isOpened()
-            if success:
-                ret, _ = cap.read()
-                success = ret
-            cap.release()
+            # DirectShow open+grab can take seconds; serve recent probes
+            # from cache and push fresh ones off the event-loop thread
+            cached = app.state.cam_probe_cache.get(index)
+            if cached and time.monotonic() - cached[0] < CAMERA_PROBE_TTL:
+                return {"index": index, "accessible": cached[1]}
+
+            loop = asyncio.get_running_loop()
+            success = await loop.run_in_executor(None, _probe_camera_sync, index)
+            app.state.cam_probe_cache[index] = (time.monotonic(), success)
             return {"index": index, "accessible": success}
         except Exception as e:
             return {"index": index, "accessible": False, "error": str(e)}
@@ -364,36 +571,24 @@ def create_api_app(controller=None) -> FastAPI:
     
     @app.get("/api/status", response_model=AppStatus, tags=["Control"])
     async def get_status():
-        """Get current application status."""
-        controller = app.state.controller
-        if controller:
-            return AppStatus(
-                running=controller.is_running,
-                paused=controller.is_paused,
-                tracking_active=controller._tracker is not None and controller._tracker.is_running if hasattr(controller, '_tracker') and controller._tracker else False,
-                camera_connected=controller._camera is not None and controller._camera.state.name == "CONNECTED" if hasattr(controller, '_camera') and controller._camera else False,
-                fps_actual=controller._camera.fps_actual if hasattr(controller, '_camera') and controller._camera and hasattr(controller._camera, 'fps_actual') else 0.0,
-                frame_count=controller.frame_count,
-                gestures_detected=0  # TODO: Add gesture counter
-            )
-        return AppStatus(
-            running=False,
-            paused=False,
-            tracking_active=False,
-            camera_connected=False,
-            fps_actual=0.0,
-            frame_count=0,
-            gestures_detected=0
-        )
+        """Get current application status (latest pump snapshot)."""
+        return app.state.last_status
     
     @app.post("/api/control/start", tags=["Control"])
     async def start_tracking():
         """Start gesture tracking."""
         controller = app.state.controller
         if controller and not controller.is_running:
-            # Start in non-blocking mode
-            threading.Thread(target=controller.start, kwargs={"blocking": True}, daemon=True).start()
-            await asyncio.sleep(0.5)  # Wait for startup
+            # Signal the worker and wait for actual readiness instead of
+            # sleeping a fixed 500 ms
+            app.state.controller_ready.clear()
+            app.state.controller_commands.put("start")
+            loop = asyncio.get_running_loop()
+            ready = await loop.run_in_executor(
+                None, app.state.controller_ready.wait, 2.0
+            )
+            if not ready or not controller.is_running:
+                raise HTTPException(status_code=500, detail="Controller failed to start")
             await _broadcast_update(app, "status_changed", {"running": True})
             return {"status": "started"}
         return {"status": "already_running"}
@@ -446,7 +641,7 @@ def create_api_app(controller=None) -> FastAPI:
     async def websocket_endpoint(websocket: WebSocket):
         """WebSocket for real-time status updates."""
         await websocket.accept()
-        app.state.ws_connections.append(websocket)
+        app.state.ws_connections.add(websocket)
         logger.info("WebSocket client connected")
         
         try:
@@ -459,8 +654,7 @@ def create_api_app(controller=None) -> FastAPI:
         except WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
         finally:
-            if websocket in app.state.ws_connections:
-                app.state.ws_connections.remove(websocket)
+            app.state.ws_connections.discard(websocket)
     
     return app
 
@@ -479,110 +673,314 @@ def _get_default_gestures_path() -> Path:
     return Path(__file__).parent.parent.parent.parent / "config" / "gestures.json"
 
 
+def _settings_mtime(path: Path) -> int:
+    """Get settings file mtime in nanoseconds (0 if missing)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file through a read-only memory map.
+
+    orjson parses the mapped pages in place, skipping the extra heap
+    buffer that read() would allocate.
+
+    Args:
+        path: JSON file to parse
+
+    Returns:
+        Decoded document
+    """
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return orjson.loads(memoryview(mapped))
+        except ValueError:  # zero-length files cannot be mapped
+            return orjson.loads(f.read())
+
+
 def _load_settings(path: Path) -> dict:
     """Load settings from JSON file."""
     if not path.exists():
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_json(path)
 
 
 def _save_settings(path: Path, settings: dict) -> None:
-    """Save settings to JSON file."""
+    """Save settings to JSON file (atomic replace)."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
 
 
 def _load_gesture_bindings(path: Path) -> List[GestureBinding]:
     """Load gesture bindings from JSON file."""
     if not path.exists():
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    bindings = []
-    for gesture, actions in data.get("gestures", {}).items():
-        for action_type, value in actions.items():
-            if action_type in ("key", "mouse", "command"):
-                bindings.append(GestureBinding(
-                    gesture=gesture,
-                    action=action_type,
-                    value=value if isinstance(value, str) else json.dumps(value),
-                    enabled=True
-                ))
-    return bindings
-
-
-def _save_gesture_bindings(path: Path, bindings: List[GestureBinding]) -> None:
-    """Save gesture bindings to JSON file."""
-    # Load existing structure
-    if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    else:
-        data = {"gestures": {}, "defaults": {}}
-    
-    # Update gestures
-    data["gestures"] = {}
+    data = _read_json(path)
+
+    # Comprehension builds the list in one C-level pass, sized as it
+    # goes, instead of per-iteration append calls
+    return [
+        GestureBinding(
+            gesture=gesture,
+            action=action_type,
+            value=value,
+            enabled=True
+        )
+        for gesture, actions in data.get("gestures", {}).items()
+        for action_type, value in actions.items()
+        if action_type in ("key", "mouse", "command")
+    ]
+
+
+def _save_gesture_bindings(
+    path: Path,
+    bindings: List[GestureBinding],
+    data: Optional[dict] = None
+) -> dict:
+    """Save gesture bindings to JSON file (atomic replace).
+
+    Args:
+        path: Gestures file location
+        bindings: Bindings to persist
+        data: Previously parsed gestures document; read from disk only
+            when not provided, since the parse is needed solely to
+            preserve the non-gesture sections
+
+    Returns:
+        The written document, for the caller to cache
+    """
+    if data is None:
+        if path.exists():
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = {"gestures": {}, "defaults": {}}
+    
+    # Update gestures; defaultdict saves a membership probe per binding
+    gestures = defaultdict(dict)
     for binding in bindings:
-        if binding.gesture not in data["gestures"]:
-            data["gestures"][binding.gesture] = {}
-        data["gestures"][binding.gesture][binding.action] = binding.value
+        gestures[binding.gesture][binding.action] = binding.value
+    data["gestures"] = dict(gestures)
     
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+    return data
 
 
-def _enumerate_cameras() -> List[CameraInfo]:
-    """Enumerate available camera devices."""
-    import cv2
-    cameras = []
-    
-    for i in range(10):  # Check first 10 indices
-        cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-        if cap.isOpened():
-            # Get camera name (Windows-specific)
-            name = f"Camera {i}"
-            
-            # Common resolutions to test
-            resolutions = []
-            test_res = [(640, 480), (1280, 720), (1920, 1080)]
-            for w, h in test_res:
-                cap.set(cv2.CAP_PROP_FRAME_WIDTH, w)
-                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, h)
-                actual_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                actual_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                if [actual_w, actual_h] not in resolutions:
-                    resolutions.append([actual_w, actual_h])
-            
-            cameras.append(CameraInfo(
-                index=i,
-                name=name,
-                resolutions=resolutions,
-                is_current=False  # Will be updated by caller
-            ))
-            cap.release()
-    
+def _probe_camera_sync(index: int) -> bool:
+    """Check camera accessibility (blocking, run in a worker thread)."""
+    if cv2 is None:
+        return False
+    # Media Foundation opens noticeably faster than DirectShow on
+    # Windows 10+; keep DirectShow as the fallback for older drivers
+    cap = cv2.VideoCapture(index, cv2.CAP_MSMF)
+    if not cap.isOpened():
+        cap.release()
+        cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+    success = cap.isOpened()
+    if success:
+        # Single-frame buffer and MJPG avoid waiting on a stale
+        # uncompressed frame during the test grab
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        ret, _ = cap.read()
+        success = ret
+    cap.release()
+    return success
+
+
+def _probe_camera_info(index: int) -> Optional[CameraInfo]:
+    """Probe a single device index for its supported resolutions.
+
+    Args:
+        index: Camera device index
+
+    Returns:
+        CameraInfo if a device responded at this index, else None
+    """
+    cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+    if not cap.isOpened():
+        cap.release()
+        return None
+
+    # Get camera name (Windows-specific)
+    name = f"Camera {index}"
+
+    # Every set()+get() pair renegotiates the capture graph (hundreds
+    # of ms). Read the native mode once and report the standard modes
+    # that fit inside it from a static table instead.
+    native_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    native_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    resolutions = [
+        [w, h] for w, h in STANDARD_RESOLUTIONS
+        if w <= native_w and h <= native_h
+    ]
+    if [native_w, native_h] not in resolutions:
+        resolutions.append([native_w, native_h])
+
+    cap.release()
+    return CameraInfo(
+        index=index,
+        name=name,
+        resolutions=resolutions,
+        is_current=False  # Will be updated by caller
+    )
+
+
+def _device_signature() -> Optional[str]:
+    """Build a cheap signature of the attached video devices.
+
+    Returns:
+        Sorted device-interface instance names joined into one string,
+        or None when unavailable (non-Windows or registry error)
+    """
+    if sys.platform != "win32":
+        return None
+    import winreg
+    try:
+        key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _VIDEO_DEVICE_CLASS_KEY)
+    except OSError:
+        return None
+
+    names = []
+    try:
+        index = 0
+        while True:
+            try:
+                names.append(winreg.EnumKey(key, index))
+            except OSError:
+                break
+            index += 1
+    finally:
+        winreg.CloseKey(key)
+    return "|".join(sorted(names))
+
+
+def _enumerate_cameras_cached(cache_path: Path) -> List[CameraInfo]:
+    """Enumerate cameras, serving from the on-disk cache when possible.
+
+    The multi-second probe re-runs only when the attached-device
+    signature has changed since the cache was written.
+
+    Args:
+        cache_path: Location of the persisted enumeration cache
+
+    Returns:
+        List of detected cameras
+    """
+    signature = _device_signature()
+    if signature is not None:
+        try:
+            data = _read_json(cache_path)
+            if data.get("signature") == signature:
+                return [CameraInfo(**info) for info in data.get("cameras", [])]
+        except (OSError, ValueError):
+            pass
+
+    cameras = _enumerate_cameras()
+
+    if signature is not None:
+        try:
+            tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+            tmp_path.write_bytes(orjson.dumps({
+                "signature": signature,
+                "cameras": [camera.model_dump() for camera in cameras],
+            }, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
     return cameras
 
 
+def _enumerate_cameras() -> List[CameraInfo]:
+    """Enumerate available camera devices.
+
+    Each DirectShow open blocks for hundreds of milliseconds in driver
+    I/O, not the GIL, so the ten indices are probed concurrently.
+    """
+    if cv2 is None:
+        return []
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(_probe_camera_info, range(10)))
+    return [camera for camera in results if camera is not None]
+
+
+def queue_broadcast(app: FastAPI, event: str, data: Any) -> None:
+    """Queue an event for broadcast from any thread.
+
+    Producers on the controller thread hand events to the serving loop
+    with one call_soon_threadsafe; the drain task coalesces bursts into
+    a single frame before fanning out.
+
+    Args:
+        app: FastAPI application
+        event: Event name
+        data: JSON-serializable payload
+    """
+    loop = getattr(app.state, "event_loop", None)
+    if loop is None:  # Server not started yet; nobody is listening
+        return
+    loop.call_soon_threadsafe(
+        app.state.broadcast_queue.put_nowait, (event, data)
+    )
+
+
+# Last encoded frame per event, so telemetry-style events that repeat
+# the same payload back-to-back skip re-serialization
+_FRAME_CACHE: Dict[str, tuple] = {}
+
+
+def _encode_frame(event: str, data: Any) -> bytes:
+    """Encode a broadcast frame, reusing the previous encoding per event.
+
+    Args:
+        event: Event name
+        data: Payload, or pre-encoded frame bytes to pass through as-is
+
+    Returns:
+        orjson-encoded frame bytes
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    cached = _FRAME_CACHE.get(event)
+    if cached is not None and cached[0] == data:
+        return cached[1]
+    payload = orjson.dumps({"event": event, "data": data})
+    _FRAME_CACHE[event] = (data, payload)
+    return payload
+
+
 async def _broadcast_update(app: FastAPI, event: str, data: Any) -> None:
     """Broadcast update to all WebSocket clients."""
-    message = json.dumps({"event": event, "data": data})
-    disconnected = []
-    
-    for ws in app.state.ws_connections:
-        try:
-            await ws.send_text(message)
-        except Exception:
-            disconnected.append(ws)
-    
-    # Remove disconnected clients
-    for ws in disconnected:
-        if ws in app.state.ws_connections:
-            app.state.ws_connections.remove(ws)
+    connections = list(app.state.ws_connections)
+    if not connections:
+        return
+
+    # Serialize once and fan out concurrently instead of re-encoding
+    # and awaiting each client in turn. Large fan-outs go out in
+    # batches with a loop yield in between so one broadcast can't
+    # monopolize the event loop.
+    payload = _encode_frame(event, data)
+    for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+        batch = connections[start:start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(ws.send_bytes(payload) for ws in batch),
+            return_exceptions=True
+        )
+
+        # Remove clients whose send failed
+        for ws, result in zip(batch, results):
+            if isinstance(result, Exception):
+                app.state.ws_connections.discard(ws)
+
+        if start + BROADCAST_BATCH_SIZE < len(connections):
+            await asyncio.sleep(0)
 
 
 async def _reload_controller_config(controller, settings: AllSettings) -> None:
@@ -663,12 +1061,24 @@ class APIServer:
         
         logger.info("Starting API server on %s:%d", self.config.host, self.config.port)
         
+        # Prefer the uvloop event loop and httptools HTTP parser where
+        # available (Linux/macOS); Windows falls back to asyncio + h11
+        # unless winloop (the uvloop port) is installed
+        loop_impl = "asyncio"
+        http_impl = "auto"
+        if sys.platform != "win32":
+            if importlib.util.find_spec("uvloop"):
+                loop_impl = "uvloop"
+            if importlib.util.find_spec("httptools"):
+                http_impl = "httptools"
+
         config = uvicorn.Config(
             self.app,
             host=self.config.host,
             port=self.config.port,
             log_level=self.config.log_level,
-            loop="asyncio"
+            loop=loop_impl,
+            http=http_impl
         )
         self._server = uvicorn.Server(config)
         
@@ -680,6 +1090,14 @@ class APIServer:
     
     def _run_server(self) -> None:
         """Run the server (called in background thread)."""
+        if sys.platform == "win32":
+            # winloop is uvloop's Windows port; installing its policy
+            # here gives the C event loop to asyncio.run below
+            try:
+                import winloop
+                winloop.install()
+            except ImportError:
+                pass
         asyncio.run(self._server.serve())
     
     def stop(self) -> None:
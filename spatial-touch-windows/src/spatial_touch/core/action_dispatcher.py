@@ -7,7 +7,9 @@ Handles mouse movement, clicks, keyboard input, and system actions.
 
 from __future__ import annotations
 
+import array
 import logging
+import sys
 import time
 from typing import Optional, Callable, Dict, Any
 from dataclasses import dataclass
@@ -24,6 +26,116 @@ logger = logging.getLogger(__name__)
 pyautogui.FAILSAFE = True  # Move mouse to corner to abort
 pyautogui.PAUSE = 0  # No pause between actions
 
+# Minimum time between dispatched cursor moves (~monitor refresh)
+MOVE_MIN_INTERVAL = 1.0 / 120.0
+
+
+class _WinMouse:
+    """Direct Win32 SendInput wrapper for the mouse hot path.
+
+    pyautogui.moveTo does argument validation, screen size queries, and
+    platform dispatch on every call — hundreds of µs at cursor rates.
+    This keeps one pre-allocated INPUT struct and mutates dx/dy per
+    call, so a cursor move is a single syscall.
+    """
+
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+    WHEEL_DELTA = 120
+
+    def __init__(self) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        self._user32 = ctypes.windll.user32
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = (
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            )
+
+        class INPUT(ctypes.Structure):
+            _fields_ = (
+                ("type", wintypes.DWORD),
+                ("mi", MOUSEINPUT),
+            )
+
+        self._input = INPUT(type=0)  # INPUT_MOUSE
+        self._ref = ctypes.byref(self._input)
+        self._size = ctypes.sizeof(INPUT)
+        self._point = wintypes.POINT()
+        self._point_ref = ctypes.byref(self._point)
+
+        # Pre-multiplied scaling into SendInput's 0..65535 virtual space
+        self._scale_x = 65535.0 / max(self._user32.GetSystemMetrics(0) - 1, 1)
+        self._scale_y = 65535.0 / max(self._user32.GetSystemMetrics(1) - 1, 1)
+
+    def _check_failsafe(self) -> None:
+        """Mirror pyautogui's corner abort for the SendInput path."""
+        if not pyautogui.FAILSAFE:
+            return
+        self._user32.GetCursorPos(self._point_ref)
+        if self._point.x == 0 and self._point.y == 0:
+            raise pyautogui.FailSafeException(
+                "Mouse cursor in screen corner (failsafe)"
+            )
+
+    def _send(self, flags: int, data: int = 0) -> None:
+        mi = self._input.mi
+        mi.mouseData = data
+        mi.dwFlags = flags
+        self._user32.SendInput(1, self._ref, self._size)
+
+    def move(self, x: int, y: int) -> None:
+        """Move cursor to absolute screen position."""
+        self._check_failsafe()
+        mi = self._input.mi
+        mi.dx = int(x * self._scale_x)
+        mi.dy = int(y * self._scale_y)
+        self._send(self.MOUSEEVENTF_MOVE | self.MOUSEEVENTF_ABSOLUTE)
+
+    def click(self, button: str = "left") -> None:
+        """Press and release a mouse button at the current position."""
+        self._check_failsafe()
+        if button == "right":
+            self._send(self.MOUSEEVENTF_RIGHTDOWN)
+            self._send(self.MOUSEEVENTF_RIGHTUP)
+        else:
+            self._send(self.MOUSEEVENTF_LEFTDOWN)
+            self._send(self.MOUSEEVENTF_LEFTUP)
+
+    def left_down(self) -> None:
+        """Press the left button (drag start)."""
+        self._check_failsafe()
+        self._send(self.MOUSEEVENTF_LEFTDOWN)
+
+    def left_up(self) -> None:
+        """Release the left button (drag end)."""
+        self._send(self.MOUSEEVENTF_LEFTUP)
+
+    def scroll(self, clicks: int) -> None:
+        """Scroll the wheel by a number of detents (negative = down)."""
+        self._check_failsafe()
+        self._send(self.MOUSEEVENTF_WHEEL, clicks * self.WHEEL_DELTA & 0xFFFFFFFF)
+
+
+_win_mouse: Optional[_WinMouse] = None
+if sys.platform == "win32":
+    try:
+        _win_mouse = _WinMouse()
+    except Exception as e:  # pragma: no cover - depends on Win32 state
+        logger.warning("SendInput unavailable, falling back to pyautogui: %s", e)
+
 
 class ActionType(Enum):
     """Types of OS actions."""
@@ -97,7 +209,10 @@ class MouseMoveExecutor(ActionExecutor):
             y: Screen Y coordinate
         """
         try:
-            pyautogui.moveTo(x, y, duration=self.duration)
+            if _win_mouse is not None and self.duration == 0:
+                _win_mouse.move(x, y)
+            else:
+                pyautogui.moveTo(x, y, duration=self.duration)
             return True
         except Exception as e:
             logger.error("Mouse move failed: %s", e)
@@ -118,7 +233,12 @@ class MouseClickExecutor(ActionExecutor):
             y: Screen Y coordinate (optional)
         """
         try:
-            pyautogui.click(x=x, y=y, button=self.button)
+            if _win_mouse is not None:
+                if x is not None and y is not None:
+                    _win_mouse.move(x, y)
+                _win_mouse.click(self.button)
+            else:
+                pyautogui.click(x=x, y=y, button=self.button)
             return True
         except Exception as e:
             logger.error("Mouse click failed: %s", e)
@@ -134,7 +254,10 @@ class MouseDragExecutor(ActionExecutor):
     def start_drag(self) -> bool:
         """Start drag (mouse down)."""
         try:
-            pyautogui.mouseDown()
+            if _win_mouse is not None:
+                _win_mouse.left_down()
+            else:
+                pyautogui.mouseDown()
             self._is_dragging = True
             return True
         except Exception as e:
@@ -144,7 +267,10 @@ class MouseDragExecutor(ActionExecutor):
     def end_drag(self) -> bool:
         """End drag (mouse up)."""
         try:
-            pyautogui.mouseUp()
+            if _win_mouse is not None:
+                _win_mouse.left_up()
+            else:
+                pyautogui.mouseUp()
             self._is_dragging = False
             return True
         except Exception as e:
@@ -178,7 +304,10 @@ class MouseScrollExecutor(ActionExecutor):
         """
         try:
             clicks = self.amount if direction == "up" else -self.amount
-            pyautogui.scroll(clicks)
+            if _win_mouse is not None:
+                _win_mouse.scroll(clicks)
+            else:
+                pyautogui.scroll(clicks)
             return True
         except Exception as e:
             logger.error("Scroll failed: %s", e)
@@ -233,12 +362,17 @@ class ActionDispatcher:
         self.config = config or ActionConfig()
         self._is_running = False
         self._executors: Dict[ActionType, ActionExecutor] = {}
-        self._last_action_time: Dict[ActionType, float] = {}
+        # Flat per-action timestamp slots (ns); cheaper than a dict of
+        # floats in the click-rate hot path
+        self._last_action_ns = array.array('q', [0] * (len(ActionType) + 1))
+        self._interval_ns = int(self.config.click_interval * 1e9)
         self._action_count = 0
         self._drag_executor: Optional[MouseDragExecutor] = None
+        self._last_move = (-1, -1, 0.0)  # (x, y, perf_counter timestamp)
         
         self._setup_executors()
-        
+        self._handlers = self._build_handlers()
+
         logger.info(
             "ActionDispatcher initialized: mouse=%s, keyboard=%s, safe_mode=%s",
             self.config.enable_mouse,
@@ -246,6 +380,30 @@ class ActionDispatcher:
             self.config.safe_mode
         )
     
+    def _build_handlers(self) -> Dict[GestureType, Callable[[Gesture], bool]]:
+        """Compile the dispatch table for the enabled action subset.
+
+        One dict probe per frame instead of an if/elif chain; config
+        enablement is evaluated once here rather than per gesture, so
+        disabled gesture types simply have no table entry.
+
+        Returns:
+            Mapping of gesture type to handler
+        """
+        handlers: Dict[GestureType, Callable[[Gesture], bool]] = {}
+        if self.config.enable_mouse:
+            handlers.update({
+                GestureType.CURSOR_MOVE: self._handle_cursor_move,
+                GestureType.LEFT_CLICK: self._handle_left_click,
+                GestureType.RIGHT_CLICK: self._handle_right_click,
+                GestureType.DRAG_START: self._handle_drag_start,
+                GestureType.DRAG_MOVE: self._handle_drag_move,
+                GestureType.DRAG_END: self._handle_drag_end,
+                GestureType.SCROLL_UP: lambda g: self._handle_scroll(g, "up"),
+                GestureType.SCROLL_DOWN: lambda g: self._handle_scroll(g, "down"),
+            })
+        return handlers
+
     def _setup_executors(self) -> None:
         """Initialize action executors."""
         self._executors = {
@@ -276,6 +434,8 @@ class ActionDispatcher:
             return
         
         logger.info("Starting action dispatcher...")
+        # Re-specialize in case the config changed since __init__
+        self._handlers = self._build_handlers()
         self._is_running = True
         logger.info("Action dispatcher started")
     
@@ -327,52 +487,35 @@ class ActionDispatcher:
         Returns:
             True if action executed
         """
-        if gesture.type == GestureType.CURSOR_MOVE:
-            return self._handle_cursor_move(gesture)
-        
-        elif gesture.type == GestureType.LEFT_CLICK:
-            return self._handle_left_click(gesture)
-        
-        elif gesture.type == GestureType.RIGHT_CLICK:
-            return self._handle_right_click(gesture)
-        
-        elif gesture.type == GestureType.DRAG_START:
-            return self._handle_drag_start(gesture)
-        
-        elif gesture.type == GestureType.DRAG_MOVE:
-            return self._handle_drag_move(gesture)
-        
-        elif gesture.type == GestureType.DRAG_END:
-            return self._handle_drag_end(gesture)
-        
-        elif gesture.type == GestureType.SCROLL_UP:
-            return self._handle_scroll(gesture, "up")
-        
-        elif gesture.type == GestureType.SCROLL_DOWN:
-            return self._handle_scroll(gesture, "down")
-        
-        return False
+        handler = self._handlers.get(gesture.type)
+        return handler(gesture) if handler else False
     
     def _handle_cursor_move(self, gesture: Gesture) -> bool:
         """Handle cursor movement."""
-        if not self.config.enable_mouse:
-            return False
-        
         # Position should be pre-mapped to screen coordinates
         x, y = gesture.metadata.get("screen_pos", gesture.position)
         
         if isinstance(x, float):
             # Still normalized, skip (should be mapped by caller)
             return False
-        
+
+        # Coalesce: skip zero-pixel deltas and cap the dispatch rate at
+        # the monitor refresh — hand tremor otherwise floods SendInput
+        last_x, last_y, last_t = self._last_move
+        now = time.perf_counter()
+        if x == last_x and y == last_y:
+            return True
+        if now - last_t < MOVE_MIN_INTERVAL:
+            return True
+
         executor = self._executors[ActionType.MOUSE_MOVE]
-        return executor.execute(x=x, y=y)
+        success = executor.execute(x=x, y=y)
+        if success:
+            self._last_move = (x, y, now)
+        return success
     
     def _handle_left_click(self, gesture: Gesture) -> bool:
         """Handle left click."""
-        if not self.config.enable_mouse:
-            return False
-        
         if not self._check_interval(ActionType.MOUSE_LEFT_CLICK):
             return False
         
@@ -386,9 +529,6 @@ class ActionDispatcher:
     
     def _handle_right_click(self, gesture: Gesture) -> bool:
         """Handle right click."""
-        if not self.config.enable_mouse:
-            return False
-        
         if not self._check_interval(ActionType.MOUSE_RIGHT_CLICK):
             return False
         
@@ -402,7 +542,7 @@ class ActionDispatcher:
     
     def _handle_drag_start(self, gesture: Gesture) -> bool:
         """Handle drag start."""
-        if not self.config.enable_mouse or not self._drag_executor:
+        if not self._drag_executor:
             return False
         
         success = self._drag_executor.start_drag()
@@ -431,9 +571,6 @@ class ActionDispatcher:
     
     def _handle_scroll(self, gesture: Gesture, direction: str) -> bool:
         """Handle scroll gesture."""
-        if not self.config.enable_mouse:
-            return False
-        
         executor = self._executors[ActionType.MOUSE_SCROLL]
         return executor.execute(direction=direction)
     
@@ -446,13 +583,13 @@ class ActionDispatcher:
         Returns:
             True if action can proceed
         """
-        current_time = time.time()
-        last_time = self._last_action_time.get(action_type, 0)
-        
-        if current_time - last_time < self.config.click_interval:
+        now = time.monotonic_ns()
+        index = action_type.value
+
+        if now - self._last_action_ns[index] < self._interval_ns:
             return False
-        
-        self._last_action_time[action_type] = current_time
+
+        self._last_action_ns[index] = now
         return True
     
     def move_cursor(self, x: int, y: int) -> bool:
@@ -8,8 +8,12 @@ reconnection and error handling.
 
 from __future__ import annotations
 
+import os
+import sys
 import time
 import threading
+from contextlib import contextmanager
+from multiprocessing import shared_memory
 from typing import Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -18,6 +22,11 @@ import logging
 import cv2
 import numpy as np
 
+# The pipeline's cv2 work (grab/retrieve plus a memory-bound BGR->RGB
+# swap) gains nothing from OpenCV's internal TBB pool, whose workers
+# otherwise contend with the capture and inference threads for cores.
+cv2.setNumThreads(1)
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +49,20 @@ class CameraConfig:
         auto_reconnect: Whether to attempt reconnection on disconnect
         reconnect_delay: Seconds to wait before reconnect attempt
         warmup_frames: Number of frames to skip during initialization
+        pixel_format: FOURCC requested from the camera (MJPG keeps
+            720p30 within USB 2.0 bandwidth; uncompressed YUY2 gets
+            silently throttled by the driver)
+        backend: Capture backend, "msmf" or "dshow" ("msmf" honors
+            BUFFERSIZE=1 and can hardware-decode MJPG; DirectShow is
+            the legacy fallback)
+        inference_resolution: Resolution requested while no display
+            consumer needs full frames; hand tracking ingests a small
+            square internally, so a lower capture size cuts USB
+            bandwidth and decode cost without hurting accuracy. None
+            disables the downscale and always captures at resolution.
+        buffer_size: Driver-side frame queue depth. 1 keeps every
+            read on the freshest frame; the default OS queue of ~4
+            frames adds ~130 ms of staleness at 30 fps.
     """
     device_index: int = 0
     resolution: Tuple[int, int] = (1280, 720)
@@ -47,10 +70,15 @@ class CameraConfig:
     auto_reconnect: bool = True
     reconnect_delay: float = 2.0
     warmup_frames: int = 10
-    
+    pixel_format: str = "MJPG"
+    backend: str = "msmf"
+    inference_resolution: Optional[Tuple[int, int]] = (640, 360)
+    buffer_size: int = 1
+
     @classmethod
     def from_dict(cls, data: dict) -> CameraConfig:
         """Create config from dictionary."""
+        inference_resolution = data.get("inference_resolution", [640, 360])
         return cls(
             device_index=data.get("device_index", 0),
             resolution=tuple(data.get("resolution", [1280, 720])),
@@ -58,6 +86,12 @@ class CameraConfig:
             auto_reconnect=data.get("auto_reconnect", True),
             reconnect_delay=data.get("reconnect_delay", 2.0),
             warmup_frames=data.get("warmup_frames", 10),
+            pixel_format=data.get("pixel_format", "MJPG"),
+            backend=data.get("backend", "msmf"),
+            inference_resolution=(
+                tuple(inference_resolution) if inference_resolution else None
+            ),
+            buffer_size=data.get("buffer_size", 1),
         )
 
 
@@ -91,13 +125,32 @@ class CameraManager:
         self.config = config or CameraConfig()
         self._state = CameraState.DISCONNECTED
         self._capture: Optional[cv2.VideoCapture] = None
-        self._frame: Optional[np.ndarray] = None
+        # Triple buffer: capture writes one slot, consumers read
+        # another, and the third hands freshly captured frames over.
+        # The lock is held only for the index swaps. The slots live in
+        # one shared-memory segment so a consumer process can map the
+        # same pages via shm_name instead of receiving frame copies.
+        self._buffers: list[Optional[np.ndarray]] = [None, None, None]
+        self._views: list[Optional[np.ndarray]] = [None, None, None]
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._frame_shape: Optional[Tuple[int, int, int]] = None
+        self._write_idx = 0
+        self._ready_idx = 1
+        self._read_idx = 2
+        self._fresh = False
+        # Slots handed out via acquire_frame; the capture thread never
+        # rotates a held slot into the write position
+        self._inuse = [False, False, False]
         self._frame_lock = threading.Lock()
+        self._frame_event = threading.Event()
+        self._warmup_cond = threading.Condition()
+        self._rgb_buffer: Optional[np.ndarray] = None
         self._running = False
+        self._hires = False
         self._capture_thread: Optional[threading.Thread] = None
         self._frame_count = 0
         self._fps_actual = 0.0
-        self._last_fps_time = time.time()
+        self._last_fps_time = time.monotonic()
         self._fps_frame_count = 0
         self._on_state_change: Optional[Callable[[CameraState], None]] = None
         
@@ -136,6 +189,21 @@ class CameraManager:
         """Get total frames captured."""
         return self._frame_count
     
+    @property
+    def shm_name(self) -> Optional[str]:
+        """Name of the shared-memory segment holding the frame slots.
+
+        A consumer process can attach with
+        SharedMemory(name=camera.shm_name) and wrap numpy views over
+        the three frame slots (see shape) without any frame copy.
+        """
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def shape(self) -> Optional[Tuple[int, int, int]]:
+        """Shape (height, width, 3) of each frame slot, or None."""
+        return self._frame_shape
+
     @property
     def is_connected(self) -> bool:
         """Check if camera is connected and capturing."""
@@ -174,14 +242,19 @@ class CameraManager:
         )
         self._capture_thread.start()
         
-        # Wait for warmup frames
-        warmup_start = time.time()
-        while self._frame_count < self.config.warmup_frames:
-            if time.time() - warmup_start > 5.0:
-                logger.error("Camera warmup timeout")
-                self.stop()
-                return False
-            time.sleep(0.1)
+        # Wait for warmup frames: the capture thread notifies the
+        # condition per frame until warmup completes, so this returns
+        # the instant the last warmup frame lands
+        warmup = self.config.warmup_frames
+        with self._warmup_cond:
+            warmed_up = self._warmup_cond.wait_for(
+                lambda: self._frame_count >= warmup,
+                timeout=5.0
+            )
+        if not warmed_up:
+            logger.error("Camera warmup timeout")
+            self.stop()
+            return False
         
         self.state = CameraState.CONNECTED
         logger.info("Camera started successfully")
@@ -199,27 +272,111 @@ class CameraManager:
         self.state = CameraState.DISCONNECTED
         logger.info("Camera stopped")
     
+    def wait_frame(self, timeout: Optional[float] = None) -> bool:
+        """Block until the capture thread publishes a new frame.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait forever
+
+        Returns:
+            True if a new frame arrived before the timeout
+        """
+        signaled = self._frame_event.wait(timeout)
+        if signaled:
+            self._frame_event.clear()
+        return signaled
+
     def get_frame(self) -> Optional[np.ndarray]:
         """Get the latest captured frame.
-        
+
+        The returned array is a read-only view of an internal buffer
+        that stays valid until the next get_frame call; copy it if it
+        must outlive that.
+
         Returns:
             BGR image as numpy array, or None if no frame available
         """
         with self._frame_lock:
-            if self._frame is not None:
-                return self._frame.copy()
-        return None
+            if self._fresh:
+                self._read_idx, self._ready_idx = self._ready_idx, self._read_idx
+                self._fresh = False
+            return self._views[self._read_idx]
     
-    def get_frame_rgb(self) -> Optional[np.ndarray]:
+    def acquire_frame(self) -> Optional[Tuple[np.ndarray, int]]:
+        """Borrow the latest frame slot without copying.
+
+        Unlike get_frame, the returned view stays valid until
+        release_frame(token) is called: the capture thread will drop
+        frames rather than rotate a held slot back into the write
+        position. Suited to heavy consumers (MediaPipe) that process
+        the buffer in place.
+
+        Returns:
+            (frame_view, token) or None if no frame is available
+        """
+        with self._frame_lock:
+            if self._fresh:
+                self._read_idx, self._ready_idx = self._ready_idx, self._read_idx
+                self._fresh = False
+            view = self._views[self._read_idx]
+            if view is None:
+                return None
+            self._inuse[self._read_idx] = True
+            return view, self._read_idx
+
+    def release_frame(self, token: int) -> None:
+        """Return a slot borrowed with acquire_frame.
+
+        Args:
+            token: Slot token from acquire_frame
+        """
+        with self._frame_lock:
+            self._inuse[token] = False
+
+    @contextmanager
+    def borrow_frame(self):
+        """Context-manager sugar over acquire_frame/release_frame.
+
+        Example:
+            >>> with camera.borrow_frame() as frame:
+            ...     if frame is not None:
+            ...         process(frame)
+        """
+        borrowed = self.acquire_frame()
+        if borrowed is None:
+            yield None
+            return
+        view, token = borrowed
+        try:
+            yield view
+        finally:
+            self.release_frame(token)
+
+    def get_frame_rgb(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Get the latest frame in RGB format.
-        
+
+        The conversion writes into ``out`` when given (and the shape
+        matches), letting callers own the destination — e.g. one slot
+        of a double buffer — so no extra copy is needed downstream.
+        Without ``out`` it writes into one reused internal buffer, so
+        like get_frame the result is only valid until the next call.
+
+        Args:
+            out: Optional preallocated destination of the frame's shape
+
         Returns:
             RGB image as numpy array, or None if no frame available
         """
         frame = self.get_frame()
-        if frame is not None:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return None
+        if frame is None:
+            return None
+        if out is not None and out.shape == frame.shape:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
+            return out
+        if self._rgb_buffer is None or self._rgb_buffer.shape != frame.shape:
+            self._rgb_buffer = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+        return self._rgb_buffer
     
     def _initialize_capture(self) -> bool:
         """Initialize video capture device.
@@ -228,29 +385,58 @@ class CameraManager:
             True if initialization successful
         """
         try:
-            # Use DirectShow backend on Windows for better compatibility
-            self._capture = cv2.VideoCapture(
-                self.config.device_index,
-                cv2.CAP_DSHOW
-            )
+            # Media Foundation by default: it honors BUFFERSIZE=1 and
+            # can hand MJPG decode to the GPU; DirectShow remains the
+            # fallback for drivers that only enumerate there
+            if self.config.backend.lower() == "msmf":
+                self._capture = cv2.VideoCapture(
+                    self.config.device_index,
+                    cv2.CAP_MSMF,
+                    [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+                )
+                if not self._capture.isOpened():
+                    logger.warning("MSMF open failed, falling back to DirectShow")
+                    self._capture.release()
+                    self._capture = None
+            
+            if self._capture is None or not self._capture.isOpened():
+                self._capture = cv2.VideoCapture(
+                    self.config.device_index,
+                    cv2.CAP_DSHOW
+                )
             
             if not self._capture.isOpened():
                 logger.error("Failed to open camera device %d", self.config.device_index)
                 return False
             
-            # Set camera properties
-            width, height = self.config.resolution
+            # Set camera properties. The fourcc goes first: DSHOW and
+            # MSMF renegotiate the format list against it, so width,
+            # height, and fps must be applied afterwards.
+            if self.config.pixel_format:
+                self._capture.set(
+                    cv2.CAP_PROP_FOURCC,
+                    cv2.VideoWriter_fourcc(*self.config.pixel_format)
+                )
+            width, height = self._requested_resolution()
             self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
             self._capture.set(cv2.CAP_PROP_FPS, self.config.fps)
             
-            # Reduce buffer size to minimize latency
-            self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            # Shallow driver queue to minimize latency: each queued
+            # frame is one frame interval of staleness
+            self._capture.set(cv2.CAP_PROP_BUFFERSIZE, self.config.buffer_size)
             
             # Verify settings
             actual_width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
             actual_height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
             actual_fps = self._capture.get(cv2.CAP_PROP_FPS)
+
+            # Size the triple-buffer slots now that the geometry is
+            # known; retrieve() decodes straight into them. All three
+            # slots share one shared-memory segment so other processes
+            # can map the frames zero-copy.
+            if actual_width > 0 and actual_height > 0:
+                self._allocate_buffers(actual_height, actual_width)
             
             logger.info(
                 "Camera initialized: %dx%d @ %.1f FPS",
@@ -263,6 +449,86 @@ class CameraManager:
             logger.error("Camera initialization error: %s", e)
             return False
     
+    def _requested_resolution(self) -> Tuple[int, int]:
+        """Resolution to request from the driver.
+
+        Inference only needs a small frame, so capture defaults to
+        inference_resolution; full resolution is used once a display
+        consumer calls request_hires().
+        """
+        if self._hires or self.config.inference_resolution is None:
+            return self.config.resolution
+        return self.config.inference_resolution
+
+    def request_hires(self, enabled: bool = True) -> bool:
+        """Switch between full and inference capture resolution.
+
+        Call with True when a display consumer (preview UI) becomes
+        visible and needs full frames, False to drop back to the
+        cheaper inference resolution. Reopens the device if capture is
+        running.
+
+        Args:
+            enabled: Whether full resolution is required
+
+        Returns:
+            True if the camera is in the requested mode
+        """
+        if enabled == self._hires:
+            return True
+        self._hires = enabled
+        if not self._running:
+            return True
+        logger.info(
+            "Reopening camera at %s resolution",
+            "full" if enabled else "inference"
+        )
+        self.stop()
+        return self.start()
+
+    def _allocate_buffers(self, height: int, width: int) -> None:
+        """Allocate the triple-buffer slots in shared memory.
+
+        Args:
+            height: Frame height in pixels
+            width: Frame width in pixels
+        """
+        frame_bytes = height * width * 3
+        self._release_buffers()
+        self._shm = shared_memory.SharedMemory(create=True, size=frame_bytes * 3)
+        self._frame_shape = (height, width, 3)
+        self._buffers = [
+            np.ndarray(
+                self._frame_shape,
+                dtype=np.uint8,
+                buffer=self._shm.buf,
+                offset=i * frame_bytes
+            )
+            for i in range(3)
+        ]
+        self._views = [self._readonly_view(b) for b in self._buffers]
+        logger.debug(
+            "Frame buffers allocated in shared memory %s (%d bytes)",
+            self._shm.name, frame_bytes * 3
+        )
+
+    def _release_buffers(self) -> None:
+        """Drop the buffer views and release the shared segment."""
+        # numpy views over shm.buf must be dropped before close(),
+        # otherwise the exported buffer keeps the mapping alive
+        self._buffers = [None, None, None]
+        self._views = [None, None, None]
+        self._inuse = [False, False, False]
+        self._frame_shape = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception as e:
+                logger.error("Error releasing shared memory: %s", e)
+            finally:
+                self._shm = None
+
     def _release_capture(self) -> None:
         """Release video capture resources."""
         if self._capture is not None:
@@ -272,16 +538,49 @@ class CameraManager:
                 logger.error("Error releasing camera: %s", e)
             finally:
                 self._capture = None
+        self._release_buffers()
     
+    @staticmethod
+    def _raise_thread_priority() -> bool:
+        """Best-effort scheduling boost for the calling thread.
+
+        Capture timing sets the floor for end-to-end input lag, so
+        the loop asks the OS for above-normal priority: TIME_CRITICAL
+        on Windows, SCHED_FIFO on Linux. Both need elevated rights;
+        failure is normal and the loop runs fine without it.
+
+        Returns:
+            True if the priority change took effect
+        """
+        try:
+            if sys.platform == "win32":
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.GetCurrentThread()
+                # 15 = THREAD_PRIORITY_TIME_CRITICAL
+                return bool(kernel32.SetThreadPriority(handle, 15))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            return True
+        except (AttributeError, OSError):
+            return False
+
     def _capture_loop(self) -> None:
-        """Main capture loop running in background thread."""
-        frame_interval = 1.0 / self.config.fps
+        """Main capture loop running in background thread.
+
+        No sleep-based pacing: grab() blocks inside the driver at the
+        camera's true cadence, so the loop wakes exactly once per
+        delivered frame instead of at scheduler granularity.
+        """
+        if not self._raise_thread_priority():
+            logger.debug(
+                "Capture thread priority unchanged "
+                "(needs admin/CAP_SYS_NICE)"
+            )
+
         reconnect_attempts = 0
         max_reconnect_attempts = 5
         
         while self._running:
-            loop_start = time.time()
-            
             try:
                 if self._capture is None or not self._capture.isOpened():
                     if self.config.auto_reconnect and reconnect_attempts < max_reconnect_attempts:
@@ -305,17 +604,54 @@ class CameraManager:
                         break
                     continue
                 
-                ret, frame = self._capture.read()
-                
+                # grab() blocks at camera cadence without decoding;
+                # retrieve() then decodes into the pre-allocated slot,
+                # avoiding a fresh ~2.7 MB allocation every frame
+                if not self._capture.grab():
+                    logger.warning("Failed to grab frame")
+                    continue
+
+                dst = self._buffers[self._write_idx]
+                ret, frame = self._capture.retrieve(dst)
+
                 if not ret or frame is None:
-                    logger.warning("Failed to read frame")
+                    logger.warning("Failed to retrieve frame")
                     continue
-                
-                # Update frame (thread-safe)
+
+                if frame is not dst:
+                    if dst is not None and frame.shape == dst.shape:
+                        # OpenCV decoded elsewhere; copy back so the
+                        # slot stays inside the shared segment
+                        np.copyto(dst, frame)
+                    else:
+                        # Geometry differs from the pre-sized slots;
+                        # rebuild the shared segment to match
+                        height, width = frame.shape[:2]
+                        with self._frame_lock:
+                            self._allocate_buffers(height, width)
+                        np.copyto(self._buffers[self._write_idx], frame)
+
+                # Publish: swap the freshly written slot in under the
+                # lock — a pointer exchange, not a frame copy. If a
+                # consumer still holds the ready slot via
+                # acquire_frame, drop this frame instead of rotating
+                # the held buffer into the write position.
                 with self._frame_lock:
-                    self._frame = frame
+                    if not self._inuse[self._ready_idx]:
+                        self._write_idx, self._ready_idx = self._ready_idx, self._write_idx
+                        self._fresh = True
+                        published = True
+                    else:
+                        published = False
+                if published:
+                    self._frame_event.set()
                 
                 self._frame_count += 1
+                # Wake start() during warmup only; once past it the
+                # per-frame condition lock is skipped entirely
+                if self._frame_count <= self.config.warmup_frames:
+                    with self._warmup_cond:
+                        self._warmup_cond.notify_all()
                 self._update_fps()
                 
                 # Reset reconnect counter on successful read
@@ -324,17 +660,22 @@ class CameraManager:
             except Exception as e:
                 logger.error("Capture loop error: %s", e)
                 self.state = CameraState.ERROR
-            
-            # Frame rate limiting
-            elapsed = time.time() - loop_start
-            sleep_time = frame_interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
     
+    @staticmethod
+    def _readonly_view(buffer: np.ndarray) -> np.ndarray:
+        """Build the read-only alias of a buffer slot for consumers."""
+        view = buffer.view()
+        view.setflags(write=False)
+        return view
+
     def _update_fps(self) -> None:
-        """Update FPS calculation."""
+        """Update FPS calculation.
+
+        Uses the monotonic clock so the once-a-second window cannot be
+        stretched or collapsed by wall-clock adjustments.
+        """
         self._fps_frame_count += 1
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self._last_fps_time
         
         if elapsed >= 1.0:
@@ -10,13 +10,18 @@ from __future__ import annotations
 import time
 import logging
 from typing import Optional, Callable, Dict, List, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
 
+import numpy as np
+
 from spatial_touch.core.hand_tracker import HandData, Point3D, HandLandmark
 
 logger = logging.getLogger(__name__)
 
+# Row indices into HandData.tips_array
+_THUMB, _INDEX, _MIDDLE = 0, 1, 2
+
 
 class GestureType(Enum):
     """Supported gesture types."""
@@ -39,22 +44,50 @@ class GestureState(Enum):
     RELEASED = auto()
 
 
-@dataclass
 class Gesture:
     """Detected gesture data.
-    
+
+    A plain __slots__ class rather than a dataclass: up to four of
+    these are built per frame, and slots keep construction cheap with
+    no per-instance __dict__. The metadata dict is only allocated on
+    first access.
+
     Attributes:
         type: Type of gesture detected
         position: Cursor position (normalized 0-1)
         confidence: Detection confidence
-        timestamp: When gesture was detected
+        timestamp: When gesture was detected (time.monotonic seconds)
         metadata: Additional gesture-specific data
     """
-    type: GestureType
-    position: tuple[float, float] = (0.0, 0.0)
-    confidence: float = 1.0
-    timestamp: float = field(default_factory=time.time)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    __slots__ = ('type', 'position', 'confidence', 'timestamp', '_metadata')
+
+    def __init__(
+        self,
+        type: GestureType,
+        position: tuple[float, float] = (0.0, 0.0),
+        confidence: float = 1.0,
+        timestamp: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.type = type
+        self.position = position
+        self.confidence = confidence
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+        self._metadata = metadata
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Gesture-specific extra data, allocated lazily."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    def __repr__(self) -> str:
+        return (
+            f"Gesture(type={self.type.name}, position={self.position}, "
+            f"confidence={self.confidence})"
+        )
 
 
 @dataclass
@@ -73,7 +106,11 @@ class GestureConfig:
     hold_time_ms: int = 300
     click_release_ms: int = 200
     velocity_threshold: float = 0.01
-    
+
+    def __post_init__(self) -> None:
+        """Precompute the squared movement threshold for the hot path."""
+        self._velocity_threshold_sq = self.velocity_threshold ** 2
+
     @classmethod
     def from_dict(cls, data: dict) -> GestureConfig:
         """Create config from dictionary."""
@@ -109,6 +146,7 @@ class PinchDetector:
         self.threshold = threshold
         self.debounce_ms = debounce_ms
         self.hold_ms = hold_ms
+        self._threshold_sq = threshold * threshold
         
         self._state = GestureState.IDLE
         self._pinch_start_time: Optional[float] = None
@@ -131,47 +169,61 @@ class PinchDetector:
         """Check if in hold state."""
         return self._state == GestureState.HOLDING
     
-    def update(self, distance: float) -> GestureState:
-        """Update pinch state based on finger distance.
-        
+    def update(self, distance_sq: float, now_ms: Optional[float] = None) -> GestureState:
+        """Update pinch state based on squared finger distance.
+
+        Takes the squared distance so callers can skip the sqrt;
+        comparing against the squared threshold is equivalent since
+        sqrt is monotonic on non-negatives.
+
         Args:
-            distance: Normalized distance between fingers
-            
+            distance_sq: Squared normalized distance between fingers
+            now_ms: Monotonic timestamp in milliseconds; sampled here
+                if not provided, so callers driving several detectors
+                can share one clock read per frame
+
         Returns:
             Current gesture state
         """
-        current_time = time.time() * 1000  # Convert to ms
+        current_time = time.monotonic() * 1000.0 if now_ms is None else now_ms
+        is_pinched = distance_sq < self._threshold_sq
         self._was_pinched = self._is_pinched
-        self._is_pinched = distance < self.threshold
-        
-        if self._state == GestureState.IDLE:
-            if self._is_pinched:
+        self._is_pinched = is_pinched
+
+        # Run the transition on locals and write the state back once;
+        # this branch ladder executes every frame, so the repeated
+        # self._state attribute loads are worth hoisting
+        state = self._state
+
+        if state is GestureState.IDLE:
+            if is_pinched:
                 # Check debounce
                 if current_time - self._last_trigger_time > self.debounce_ms:
-                    self._state = GestureState.TRIGGERED
+                    state = GestureState.TRIGGERED
                     self._pinch_start_time = current_time
-                    
-        elif self._state == GestureState.TRIGGERED:
-            if not self._is_pinched:
+
+        elif state is GestureState.TRIGGERED:
+            if not is_pinched:
                 # Released quickly = click
-                self._state = GestureState.RELEASED
+                state = GestureState.RELEASED
                 self._last_trigger_time = current_time
             elif self._pinch_start_time:
                 # Check if holding
                 if current_time - self._pinch_start_time > self.hold_ms:
-                    self._state = GestureState.HOLDING
-                    
-        elif self._state == GestureState.HOLDING:
-            if not self._is_pinched:
-                self._state = GestureState.RELEASED
+                    state = GestureState.HOLDING
+
+        elif state is GestureState.HOLDING:
+            if not is_pinched:
+                state = GestureState.RELEASED
                 self._last_trigger_time = current_time
-                
-        elif self._state == GestureState.RELEASED:
+
+        elif state is GestureState.RELEASED:
             # Transition back to idle
-            self._state = GestureState.IDLE
+            state = GestureState.IDLE
             self._pinch_start_time = None
-        
-        return self._state
+
+        self._state = state
+        return state
     
     def reset(self) -> None:
         """Reset detector state."""
@@ -213,14 +265,21 @@ class GestureEngine:
             hold_ms=self.config.hold_time_ms
         )
         
-        # Gesture callbacks
-        self._callbacks: Dict[GestureType, List[Callable[[Gesture], None]]] = {
-            gesture_type: [] for gesture_type in GestureType
-        }
+        # Gesture callbacks, indexed by GestureType.value: a flat list
+        # subscript beats an enum-keyed dict lookup on the per-gesture path
+        self._callbacks: List[List[Callable[[Gesture], None]]] = [
+            [] for _ in range(len(GestureType) + 1)
+        ]
         
         # Tracking state
         self._last_position: Optional[tuple[float, float]] = None
         self._is_dragging = False
+
+        # Pooled CURSOR_MOVE gesture, mutated in place each frame;
+        # consumers in this repo handle gestures synchronously, so a
+        # single reused instance is safe and avoids the per-frame
+        # allocation for the most frequent gesture
+        self._cursor_gesture = Gesture(type=GestureType.CURSOR_MOVE)
         
         logger.info(
             "GestureEngine initialized: pinch_threshold=%.3f, debounce=%dms",
@@ -239,7 +298,7 @@ class GestureEngine:
             gesture_type: Type of gesture to listen for
             callback: Function to call when gesture detected
         """
-        self._callbacks[gesture_type].append(callback)
+        self._callbacks[gesture_type.value].append(callback)
         logger.debug("Registered callback for %s", gesture_type.name)
     
     def off_gesture(
@@ -253,8 +312,8 @@ class GestureEngine:
             gesture_type: Type of gesture
             callback: Callback to remove
         """
-        if callback in self._callbacks[gesture_type]:
-            self._callbacks[gesture_type].remove(callback)
+        if callback in self._callbacks[gesture_type.value]:
+            self._callbacks[gesture_type.value].remove(callback)
     
     def process(self, hand: HandData) -> List[Gesture]:
         """Process hand data and detect gestures.
@@ -271,36 +330,40 @@ class GestureEngine:
             self._reset_on_no_hand()
             return gestures
         
-        # Get finger positions
-        thumb_tip = hand.thumb_tip
-        index_tip = hand.index_tip
-        middle_tip = hand.middle_tip
-        
-        if not all([thumb_tip, index_tip, middle_tip]):
+        # Get fingertip positions as one array
+        tips = hand.tips_array
+
+        if tips is None:
             return gestures
-        
+
         # Current cursor position (from index finger)
-        cursor_pos = (index_tip.x, index_tip.y)
-        
-        # Calculate pinch distances
-        left_distance = thumb_tip.distance_to(index_tip)
-        right_distance = thumb_tip.distance_to(middle_tip)
-        
+        cursor_pos = (tips[_INDEX, 0], tips[_INDEX, 1])
+
+        # Sample the clock once per frame; detectors and gesture
+        # timestamps all share it
+        now = time.monotonic()
+        now_ms = now * 1000.0
+
+        # Both squared pinch distances in one vectorized operation;
+        # detectors compare in squared space so the sqrt is never needed
+        diffs = tips[[_THUMB, _THUMB]] - tips[[_INDEX, _MIDDLE]]
+        left_distance_sq, right_distance_sq = np.einsum('ij,ij->i', diffs, diffs)
+
         # Update pinch detectors
-        left_state = self._left_pinch.update(left_distance)
-        right_state = self._right_pinch.update(right_distance)
-        
+        left_state = self._left_pinch.update(left_distance_sq, now_ms)
+        right_state = self._right_pinch.update(right_distance_sq, now_ms)
+
         # Handle cursor movement
-        cursor_gesture = self._process_cursor_move(cursor_pos)
+        cursor_gesture = self._process_cursor_move(cursor_pos, now)
         if cursor_gesture:
             gestures.append(cursor_gesture)
-        
+
         # Handle left click/drag (thumb + index)
-        left_gestures = self._process_left_pinch(left_state, cursor_pos)
+        left_gestures = self._process_left_pinch(left_state, cursor_pos, now)
         gestures.extend(left_gestures)
-        
+
         # Handle right click (thumb + middle)
-        right_gesture = self._process_right_pinch(right_state, cursor_pos)
+        right_gesture = self._process_right_pinch(right_state, cursor_pos, now)
         if right_gesture:
             gestures.append(right_gesture)
         
@@ -314,105 +377,118 @@ class GestureEngine:
         return gestures
     
     def _process_cursor_move(
-        self, 
-        position: tuple[float, float]
+        self,
+        position: tuple[float, float],
+        now: float
     ) -> Optional[Gesture]:
         """Process cursor movement.
-        
+
         Args:
             position: Current cursor position
-            
+            now: Frame timestamp (time.monotonic seconds)
+
         Returns:
             Cursor move gesture or None
         """
-        if self._last_position is None:
+        last = self._last_position
+        if last is None:
             return None
-        
+
         # Calculate movement delta
-        dx = abs(position[0] - self._last_position[0])
-        dy = abs(position[1] - self._last_position[1])
-        
-        # Only emit if moved significantly
-        if dx > self.config.velocity_threshold or dy > self.config.velocity_threshold:
-            return Gesture(
-                type=GestureType.CURSOR_MOVE,
-                position=position,
-                metadata={"delta": (dx, dy)}
-            )
-        
+        dx = position[0] - last[0]
+        dy = position[1] - last[1]
+
+        # Only emit if moved significantly: squared delta against the
+        # pre-squared threshold skips the abs calls and second compare
+        if dx * dx + dy * dy > self.config._velocity_threshold_sq:
+            gesture = self._cursor_gesture
+            gesture.position = position
+            gesture.timestamp = now
+            gesture.metadata["delta"] = (dx, dy)
+            return gesture
+
         return None
     
     def _process_left_pinch(
-        self, 
-        state: GestureState, 
-        position: tuple[float, float]
+        self,
+        state: GestureState,
+        position: tuple[float, float],
+        now: float
     ) -> List[Gesture]:
         """Process left pinch (click/drag).
-        
+
         Args:
             state: Current pinch state
             position: Current position
-            
+            now: Frame timestamp (time.monotonic seconds)
+
         Returns:
             List of gestures
         """
         gestures = []
-        
+
         if state == GestureState.TRIGGERED:
             if not self._is_dragging:
                 # Start potential drag
                 pass
-                
+
         elif state == GestureState.HOLDING:
             if not self._is_dragging:
                 # Start drag
                 self._is_dragging = True
                 gestures.append(Gesture(
                     type=GestureType.DRAG_START,
-                    position=position
+                    position=position,
+                    timestamp=now
                 ))
             else:
                 # Continue drag
                 gestures.append(Gesture(
                     type=GestureType.DRAG_MOVE,
-                    position=position
+                    position=position,
+                    timestamp=now
                 ))
-                
+
         elif state == GestureState.RELEASED:
             if self._is_dragging:
                 # End drag
                 self._is_dragging = False
                 gestures.append(Gesture(
                     type=GestureType.DRAG_END,
-                    position=position
+                    position=position,
+                    timestamp=now
                 ))
             else:
                 # Regular click
                 gestures.append(Gesture(
                     type=GestureType.LEFT_CLICK,
-                    position=position
+                    position=position,
+                    timestamp=now
                 ))
-        
+
         return gestures
-    
+
     def _process_right_pinch(
-        self, 
-        state: GestureState, 
-        position: tuple[float, float]
+        self,
+        state: GestureState,
+        position: tuple[float, float],
+        now: float
     ) -> Optional[Gesture]:
         """Process right pinch (right click).
-        
+
         Args:
             state: Current pinch state
             position: Current position
-            
+            now: Frame timestamp (time.monotonic seconds)
+
         Returns:
             Right click gesture or None
         """
         if state == GestureState.RELEASED:
             return Gesture(
                 type=GestureType.RIGHT_CLICK,
-                position=position
+                position=position,
+                timestamp=now
             )
         return None
     
@@ -422,7 +498,7 @@ class GestureEngine:
         Args:
             gesture: Detected gesture
         """
-        for callback in self._callbacks[gesture.type]:
+        for callback in self._callbacks[gesture.type.value]:
             try:
                 callback(gesture)
             except Exception as e:
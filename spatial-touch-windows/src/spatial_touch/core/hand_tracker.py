@@ -8,17 +8,26 @@ Provides smoothed landmark data with confidence filtering.
 from __future__ import annotations
 
 import logging
-from typing import Optional, List, NamedTuple, Tuple
+import math
+import operator
+import queue
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional, List, NamedTuple, Tuple, Union
 from dataclasses import dataclass, field
 from enum import IntEnum
 
+import cv2
 import numpy as np
 import mediapipe as mp
 
-from spatial_touch.utils.smoothing import ExponentialMovingAverage
-
 logger = logging.getLogger(__name__)
 
+# Pulls (x, y, z) off a protobuf landmark in one C-level call instead
+# of three descriptor lookups
+_XYZ = operator.attrgetter('x', 'y', 'z')
+
 
 class HandLandmark(IntEnum):
     """MediaPipe hand landmark indices.
@@ -56,7 +65,21 @@ class Point3D(NamedTuple):
     
     def distance_to(self, other: Point3D) -> float:
         """Calculate Euclidean distance to another point."""
-        return np.sqrt(
+        # One C-level call, no numpy ufunc dispatch, and hypot scales
+        # its inputs to avoid intermediate overflow
+        return math.hypot(
+            self.x - other.x,
+            self.y - other.y,
+            self.z - other.z
+        )
+
+    def distance_sq_to(self, other: Point3D) -> float:
+        """Calculate squared Euclidean distance to another point.
+
+        Cheaper than distance_to for threshold comparisons: compare
+        against the squared threshold and skip the sqrt.
+        """
+        return (
             (self.x - other.x) ** 2 +
             (self.y - other.y) ** 2 +
             (self.z - other.z) ** 2
@@ -71,21 +94,60 @@ class Point3D(NamedTuple):
         return (self.x, self.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class HandData:
     """Processed hand landmark data.
-    
+
     Attributes:
-        landmarks: List of 21 hand landmarks as Point3D
+        landmarks: The 21 hand landmarks, either a list of Point3D or
+            a (21, 3) coordinate array (the tracker supplies the
+            latter; Point3D accessors adapt either way)
         handedness: 'Left' or 'Right'
         confidence: Detection confidence score (0-1)
         is_valid: Whether the hand data is valid
+        landmarks_xyz: All 21 landmarks as a (21, 3) float array, when
+            the producer supplies one; lets consumers index coordinates
+            without materializing Point3D objects
     """
-    landmarks: List[Point3D] = field(default_factory=list)
+
+    # Fingertip landmarks in tips_array row order
+    TIP_INDICES = (
+        HandLandmark.THUMB_TIP,
+        HandLandmark.INDEX_TIP,
+        HandLandmark.MIDDLE_TIP,
+        HandLandmark.RING_TIP,
+        HandLandmark.PINKY_TIP,
+    )
+
+    landmarks: Union[List[Point3D], np.ndarray] = field(default_factory=list)
     handedness: str = "Unknown"
     confidence: float = 0.0
     is_valid: bool = False
-    
+    landmarks_xyz: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    @property
+    def tips_array(self) -> Optional[np.ndarray]:
+        """Fingertip coordinates as a (5, 3) float array.
+
+        Rows follow TIP_INDICES order (thumb, index, middle, ring, pinky).
+        Sliced from landmarks_xyz when available, otherwise built from
+        the Point3D list. Lets distance math run as a single NumPy
+        operation instead of per-point Python arithmetic.
+
+        Returns:
+            (5, 3) ndarray or None if the hand data is invalid
+        """
+        if not self.is_valid:
+            return None
+        if self.landmarks_xyz is not None:
+            return self.landmarks_xyz[list(self.TIP_INDICES)]
+        if len(self.landmarks) < HandLandmark.PINKY_TIP + 1:
+            return None
+        return np.array(
+            [self.landmarks[i] for i in self.TIP_INDICES],
+            dtype=np.float64
+        )
+
     @property
     def wrist(self) -> Optional[Point3D]:
         """Get wrist landmark."""
@@ -119,9 +181,25 @@ class HandData:
     def _get_landmark(self, index: HandLandmark) -> Optional[Point3D]:
         """Get landmark by index safely."""
         if self.is_valid and 0 <= index < len(self.landmarks):
-            return self.landmarks[index]
+            lm = self.landmarks[index]
+            return lm if isinstance(lm, Point3D) else Point3D(*lm)
         return None
     
+    def as_array(self) -> Optional[np.ndarray]:
+        """All landmarks as a (21, 3) coordinate array.
+
+        For consumers doing bulk math, e.g.
+        np.linalg.norm(hand.as_array() - wrist, axis=1).
+
+        Returns:
+            (21, 3) ndarray or None if the hand data is invalid
+        """
+        if not self.is_valid or len(self.landmarks) == 0:
+            return None
+        if self.landmarks_xyz is not None:
+            return self.landmarks_xyz
+        return np.asarray(self.landmarks, dtype=np.float64)
+
     def get_landmark(self, index: int) -> Optional[Point3D]:
         """Get landmark by index.
         
@@ -134,7 +212,13 @@ class HandData:
         return self._get_landmark(HandLandmark(index))
 
 
-@dataclass
+# Shared invalid-hand instance returned on no-hand and error frames;
+# semantically immutable, so one allocation serves every such frame.
+# Callers must treat HandData as read-only (they already do).
+_EMPTY_HAND = HandData()
+
+
+@dataclass(slots=True)
 class TrackerConfig:
     """Hand tracker configuration.
     
@@ -145,6 +229,15 @@ class TrackerConfig:
         model_complexity: Model complexity (0, 1)
         smoothing_factor: Landmark smoothing factor (0-1)
         static_image_mode: Use static image mode (slower but more accurate)
+        use_gpu: Run inference through the MediaPipe Tasks GPU
+            delegate where the platform supports it (not Windows);
+            falls back to the CPU solutions path otherwise
+        model_asset_path: Path to the hand_landmarker.task model
+            bundle, required for the GPU path
+        input_size: Side length frames are downscaled to before
+            inference; MediaPipe resizes internally anyway, so feeding
+            it a pre-shrunk square cuts the bytes it must copy without
+            changing the normalized landmark outputs. 0 disables.
     """
     max_hands: int = 1
     min_detection_confidence: float = 0.7
@@ -152,7 +245,10 @@ class TrackerConfig:
     model_complexity: int = 1
     smoothing_factor: float = 0.4
     static_image_mode: bool = False
-    
+    use_gpu: bool = False
+    model_asset_path: str = ""
+    input_size: int = 256
+
     @classmethod
     def from_dict(cls, data: dict) -> TrackerConfig:
         """Create config from dictionary."""
@@ -163,6 +259,9 @@ class TrackerConfig:
             model_complexity=data.get("model_complexity", 1),
             smoothing_factor=data.get("smoothing_factor", 0.4),
             static_image_mode=data.get("static_image_mode", False),
+            use_gpu=data.get("use_gpu", False),
+            model_asset_path=data.get("model_asset_path", ""),
+            input_size=data.get("input_size", 256),
         )
 
 
@@ -182,7 +281,17 @@ class HandTracker:
     """
     
     NUM_LANDMARKS = 21
-    
+
+    __slots__ = (
+        'config', '_hands', '_ema_state', '_alpha',
+        '_landmark_buf', '_ema_scratch',
+        '_is_running', '_last_hand', '_frames_without_hand',
+        '_use_tasks', '_last_timestamp_ms',
+        '_pipeline_threads', '_pipeline_stop',
+        '_frame_buffers', '_frame_views', '_buf_idx', '_buf_lock',
+        '_resize_buf', '_resize_view',
+    )
+
     def __init__(self, config: Optional[TrackerConfig] = None) -> None:
         """Initialize hand tracker.
         
@@ -191,10 +300,37 @@ class HandTracker:
         """
         self.config = config or TrackerConfig()
         self._hands: Optional[mp.solutions.hands.Hands] = None
-        self._smoothers: List[ExponentialMovingAverage] = []
+        # EMA state for all 21 landmarks as one (21, 3) array; the
+        # recurrence runs as a single vector op per frame instead of
+        # 63 scalar smoother calls
+        self._ema_state: Optional[np.ndarray] = None
+        self._alpha = self.config.smoothing_factor
+        # Reused extraction target; raw landmarks land here each frame
+        self._landmark_buf = np.empty((self.NUM_LANDMARKS, 3), dtype=np.float64)
+        # Scratch for the EMA's scaled-input term, so the recurrence
+        # runs with no per-frame temporaries
+        self._ema_scratch = np.empty_like(self._landmark_buf)
         self._is_running = False
         self._last_hand: Optional[HandData] = None
         self._frames_without_hand = 0
+        # GPU (Tasks API) path state
+        self._use_tasks = False
+        self._last_timestamp_ms = 0
+        # Pipeline-mode threads (see start_pipeline)
+        self._pipeline_threads: List[threading.Thread] = []
+        self._pipeline_stop: Optional[threading.Event] = None
+        # Double-buffered input frames: the producer fills one slot
+        # while inference reads the other (see acquire_write_buffer).
+        # _frame_views holds read-only views over the same memory;
+        # MediaPipe passes read-only frames by reference instead of
+        # copying them, so consumers always get the view
+        self._frame_buffers: List[Optional[np.ndarray]] = [None, None]
+        self._frame_views: List[Optional[np.ndarray]] = [None, None]
+        self._buf_idx = 0
+        self._buf_lock = threading.Lock()
+        # Reused inference-size frame (see _downscale)
+        self._resize_buf: Optional[np.ndarray] = None
+        self._resize_view: Optional[np.ndarray] = None
         
         logger.info(
             "HandTracker initialized: max_hands=%d, detection_conf=%.2f, "
@@ -227,21 +363,33 @@ class HandTracker:
             return
         
         logger.info("Starting hand tracker...")
-        
-        self._hands = mp.solutions.hands.Hands(
-            static_image_mode=self.config.static_image_mode,
-            max_num_hands=self.config.max_hands,
-            min_detection_confidence=self.config.min_detection_confidence,
-            min_tracking_confidence=self.config.min_tracking_confidence,
-            model_complexity=self.config.model_complexity,
-        )
-        
-        # Initialize smoothers for each landmark coordinate (21 landmarks × 3 coords)
-        self._smoothers = [
-            ExponentialMovingAverage(alpha=self.config.smoothing_factor)
-            for _ in range(self.NUM_LANDMARKS * 3)
-        ]
-        
+
+        self._use_tasks = False
+        if (self.config.use_gpu and sys.platform != "win32"
+                and self.config.model_asset_path):
+            try:
+                self._hands = self._create_gpu_landmarker()
+                self._use_tasks = True
+                logger.info("Using MediaPipe Tasks GPU delegate")
+            except Exception as e:
+                logger.warning(
+                    "GPU landmarker unavailable (%s), using CPU solutions path", e
+                )
+                self._hands = None
+
+        if not self._use_tasks:
+            self._hands = mp.solutions.hands.Hands(
+                static_image_mode=self.config.static_image_mode,
+                max_num_hands=self.config.max_hands,
+                min_detection_confidence=self.config.min_detection_confidence,
+                min_tracking_confidence=self.config.min_tracking_confidence,
+                model_complexity=self.config.model_complexity,
+            )
+
+        self._last_timestamp_ms = 0
+        self._ema_state = None
+        self._alpha = self.config.smoothing_factor
+
         self._is_running = True
         self._frames_without_hand = 0
         
@@ -253,12 +401,14 @@ class HandTracker:
             return
         
         logger.info("Stopping hand tracker...")
-        
+
+        self.stop_pipeline()
+
         if self._hands is not None:
             self._hands.close()
             self._hands = None
         
-        self._smoothers.clear()
+        self._ema_state = None
         self._is_running = False
         self._last_hand = None
         
@@ -275,92 +425,337 @@ class HandTracker:
         """
         if not self._is_running or self._hands is None:
             logger.warning("Tracker not running, call start() first")
-            return HandData()
-        
+            return _EMPTY_HAND
+
         try:
-            # Process frame with MediaPipe
-            results = self._hands.process(frame)
-            
-            if not results.multi_hand_landmarks:
-                self._frames_without_hand += 1
-                self._last_hand = HandData()
-                return self._last_hand
-            
-            # Reset counter on detection
-            self._frames_without_hand = 0
-            
-            # Get first hand (primary hand)
-            hand_landmarks = results.multi_hand_landmarks[0]
-            
-            # Get handedness
-            handedness = "Unknown"
-            confidence = 0.0
-            if results.multi_handedness:
-                hand_info = results.multi_handedness[0].classification[0]
-                # MediaPipe returns mirrored handedness, so flip it
-                handedness = "Right" if hand_info.label == "Left" else "Left"
-                confidence = hand_info.score
-            
-            # Extract and smooth landmarks
-            landmarks = self._extract_landmarks(hand_landmarks)
-            smoothed_landmarks = self._smooth_landmarks(landmarks)
-            
-            self._last_hand = HandData(
-                landmarks=smoothed_landmarks,
-                handedness=handedness,
-                confidence=confidence,
-                is_valid=True
-            )
-            
-            return self._last_hand
-            
+            return self._build_hand(self._detect(frame))
         except Exception as e:
             logger.error("Hand processing error: %s", e)
-            return HandData()
-    
-    def _extract_landmarks(
-        self, 
-        hand_landmarks: mp.solutions.hands.HandLandmark
-    ) -> List[Point3D]:
-        """Extract landmarks as Point3D list.
-        
+            return _EMPTY_HAND
+
+    def _detect(self, frame: np.ndarray):
+        """Run MediaPipe inference on one frame.
+
+        Must only be called from a single thread at a time — the
+        MediaPipe graph is not thread-safe.
+
         Args:
-            hand_landmarks: MediaPipe hand landmarks
-            
+            frame: RGB image as numpy array
+
         Returns:
-            List of 21 Point3D landmarks
+            (landmark_seq, label, score) for the primary hand, or None
         """
-        landmarks = []
-        for lm in hand_landmarks.landmark:
-            landmarks.append(Point3D(x=lm.x, y=lm.y, z=lm.z))
-        return landmarks
-    
-    def _smooth_landmarks(self, landmarks: List[Point3D]) -> List[Point3D]:
-        """Apply smoothing to landmarks.
-        
+        frame = self._downscale(frame)
+
+        if self._use_tasks:
+            return self._detect_tasks(frame)
+
+        results = self._hands.process(frame)
+        if not results.multi_hand_landmarks:
+            return None
+
+        label, score = None, 0.0
+        if results.multi_handedness:
+            hand_info = results.multi_handedness[0].classification[0]
+            label, score = hand_info.label, hand_info.score
+        return results.multi_hand_landmarks[0].landmark, label, score
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink a frame to the configured inference input size.
+
+        Landmarks come back normalized to the input, so downstream
+        consumers see identical coordinates; only the bytes MediaPipe
+        must ingest change. The resize writes into a reused buffer.
+
         Args:
-            landmarks: Raw landmark list
-            
+            frame: RGB image as numpy array
+
         Returns:
-            Smoothed landmark list
+            Downscaled frame, or the original if already small enough
         """
-        smoothed = []
-        
-        for i, point in enumerate(landmarks):
-            base_idx = i * 3
-            
-            smooth_x = self._smoothers[base_idx].update(point.x)
-            smooth_y = self._smoothers[base_idx + 1].update(point.y)
-            smooth_z = self._smoothers[base_idx + 2].update(point.z)
-            
-            smoothed.append(Point3D(x=smooth_x, y=smooth_y, z=smooth_z))
-        
-        return smoothed
+        size = self.config.input_size
+        if not size or (frame.shape[0] <= size and frame.shape[1] <= size):
+            return frame
+        if self._resize_buf is None or self._resize_buf.shape[:2] != (size, size):
+            self._resize_buf = np.empty((size, size, 3), dtype=np.uint8)
+            self._resize_view = self._resize_buf.view()
+            self._resize_view.flags.writeable = False
+        cv2.resize(
+            frame, (size, size),
+            dst=self._resize_buf,
+            interpolation=cv2.INTER_AREA
+        )
+        # Read-only alias: MediaPipe takes it by reference, a
+        # writeable frame it would copy
+        return self._resize_view
+
+    def _build_hand(self, detection) -> HandData:
+        """Turn a detection into smoothed HandData.
+
+        Args:
+            detection: Result of _detect, or None for no hand
+
+        Returns:
+            HandData (invalid when detection is None)
+        """
+        if detection is None:
+            self._frames_without_hand += 1
+            self._last_hand = _EMPTY_HAND
+            return _EMPTY_HAND
+
+        # Reset counter on detection
+        self._frames_without_hand = 0
+
+        landmark_seq, label, confidence = detection
+
+        # MediaPipe returns mirrored handedness, so flip it
+        if label is None:
+            handedness = "Unknown"
+        else:
+            handedness = "Right" if label == "Left" else "Left"
+
+        # Extract and smooth landmarks
+        landmarks = self._extract_landmarks(landmark_seq)
+        smoothed_landmarks = self._smooth_landmarks(landmarks)
+
+        self._last_hand = HandData(
+            landmarks=smoothed_landmarks,
+            handedness=handedness,
+            confidence=confidence,
+            is_valid=True,
+            # The smoothed array doubles as the coordinate view so
+            # downstream math indexes it without conversion
+            landmarks_xyz=smoothed_landmarks
+        )
+
+        return self._last_hand
     
+    def _create_gpu_landmarker(self):
+        """Build a Tasks-API hand landmarker on the GPU delegate.
+
+        Returns:
+            A vision.HandLandmarker in VIDEO running mode
+
+        Raises:
+            Exception: If the Tasks API or GPU delegate is unavailable
+        """
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision
+
+        options = vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(
+                model_asset_path=self.config.model_asset_path,
+                delegate=mp_tasks.BaseOptions.Delegate.GPU,
+            ),
+            running_mode=vision.RunningMode.VIDEO,
+            num_hands=self.config.max_hands,
+            min_hand_detection_confidence=self.config.min_detection_confidence,
+            min_tracking_confidence=self.config.min_tracking_confidence,
+        )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def _detect_tasks(self, frame: np.ndarray):
+        """Run one frame through the Tasks-API landmarker.
+
+        Args:
+            frame: RGB image as numpy array
+
+        Returns:
+            (landmark_seq, label, score) for the primary hand, or None
+        """
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
+        # detect_for_video requires strictly increasing timestamps
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+
+        result = self._hands.detect_for_video(mp_image, timestamp_ms)
+        if not result.hand_landmarks:
+            return None
+
+        label, score = None, 0.0
+        if result.handedness:
+            category = result.handedness[0][0]
+            label, score = category.category_name, category.score
+        return result.hand_landmarks[0], label, score
+
+    def _extract_landmarks(self, landmark_seq) -> np.ndarray:
+        """Extract landmarks as a coordinate array.
+
+        Writes into one reused buffer (valid until the next call) with
+        a single attrgetter tuple unpack per landmark, instead of
+        three protobuf descriptor lookups each. Works on either the
+        solutions repeated field or a Tasks-API landmark list.
+
+        Args:
+            landmark_seq: Sequence of landmark objects with x/y/z
+
+        Returns:
+            (21, 3) array of landmark coordinates
+        """
+        buf = self._landmark_buf
+        for i, lm in enumerate(landmark_seq):
+            buf[i] = _XYZ(lm)
+        return buf
+
+    def _smooth_landmarks(self, landmarks: np.ndarray) -> np.ndarray:
+        """Apply EMA smoothing to the landmark array.
+
+        One vectorized recurrence (state = alpha*new + (1-alpha)*state)
+        over the whole (21, 3) array, updating the persistent state in
+        place.
+
+        Args:
+            landmarks: Raw (21, 3) landmark array
+
+        Returns:
+            Smoothed (21, 3) landmark array (a fresh copy, safe to
+            retain across frames)
+        """
+        if self._ema_state is None or self._ema_state.shape != landmarks.shape:
+            self._ema_state = landmarks.astype(np.float64, copy=True)
+        else:
+            # Both terms write into preallocated buffers, so the
+            # update touches no allocator on the hot path
+            np.multiply(self._ema_state, 1.0 - self._alpha, out=self._ema_state)
+            np.multiply(landmarks, self._alpha, out=self._ema_scratch)
+            self._ema_state += self._ema_scratch
+        return self._ema_state.copy()
+
+    def acquire_write_buffer(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Get the current write slot of the input double buffer.
+
+        A frame producer (the camera thread) writes RGB data directly
+        into this buffer — e.g. cv2.cvtColor(..., dst=buf) — while
+        inference reads the other slot, so no transient frame arrays
+        are allocated per frame. Call swap_write_buffer when the write
+        is complete.
+
+        Args:
+            shape: Frame shape (height, width, 3)
+
+        Returns:
+            Contiguous uint8 buffer of the requested shape
+        """
+        buf = self._frame_buffers[self._buf_idx]
+        if buf is None or buf.shape != tuple(shape):
+            buf = np.empty(shape, dtype=np.uint8)
+            self._frame_buffers[self._buf_idx] = buf
+            # Published alongside the slot: a read-only alias that
+            # MediaPipe accepts by reference rather than copying
+            view = buf.view()
+            view.flags.writeable = False
+            self._frame_views[self._buf_idx] = view
+        return buf
+
+    def swap_write_buffer(self) -> np.ndarray:
+        """Flip the double buffer, publishing the written frame.
+
+        Returns:
+            A read-only view of the just-filled buffer, ready to pass
+            to process()
+        """
+        with self._buf_lock:
+            filled = self._frame_views[self._buf_idx]
+            self._buf_idx = 1 - self._buf_idx
+        return filled
+
+    def start_pipeline(
+        self,
+        frame_source: Iterable[np.ndarray],
+        on_hand: Callable[[HandData], None]
+    ) -> None:
+        """Run capture, inference, and smoothing as a staged pipeline.
+
+        Three daemon threads connected by bounded queues: a reader
+        draining frame_source, an inference worker (the only thread
+        that touches the MediaPipe graph), and a consumer that smooths
+        and hands HandData to on_hand. The maxsize=2 queues provide
+        back-pressure, so steady-state throughput is set by the
+        slowest stage rather than the sum of all three. The
+        synchronous process() API is unaffected but must not be called
+        while the pipeline is running.
+
+        Args:
+            frame_source: Iterable yielding RGB frames; the pipeline
+                ends when it is exhausted
+            on_hand: Callback receiving each HandData
+        """
+        if self._pipeline_threads:
+            logger.warning("Pipeline already running")
+            return
+        if not self._is_running:
+            logger.warning("Tracker not running, call start() first")
+            return
+
+        stop = threading.Event()
+        self._pipeline_stop = stop
+        frame_q: queue.Queue = queue.Queue(maxsize=2)
+        detect_q: queue.Queue = queue.Queue(maxsize=2)
+
+        def _put(q: queue.Queue, item) -> bool:
+            """Blocking put that stays responsive to shutdown."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _reader() -> None:
+            for frame in frame_source:
+                if stop.is_set() or not _put(frame_q, frame):
+                    break
+
+        def _inferer() -> None:
+            while not stop.is_set():
+                try:
+                    frame = frame_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                try:
+                    detection = self._detect(frame)
+                except Exception as e:
+                    logger.error("Pipeline inference error: %s", e)
+                    continue
+                _put(detect_q, detection)
+
+        def _consumer() -> None:
+            while not stop.is_set():
+                try:
+                    detection = detect_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                hand = self._build_hand(detection)
+                try:
+                    on_hand(hand)
+                except Exception as e:
+                    logger.error("on_hand callback error: %s", e)
+
+        self._pipeline_threads = [
+            threading.Thread(target=_reader, name="TrackerReader", daemon=True),
+            threading.Thread(target=_inferer, name="TrackerInference", daemon=True),
+            threading.Thread(target=_consumer, name="TrackerConsumer", daemon=True),
+        ]
+        for thread in self._pipeline_threads:
+            thread.start()
+        logger.info("Tracker pipeline started")
+
+    def stop_pipeline(self) -> None:
+        """Stop the pipeline threads, if running."""
+        if not self._pipeline_threads:
+            return
+        if self._pipeline_stop is not None:
+            self._pipeline_stop.set()
+        for thread in self._pipeline_threads:
+            thread.join(timeout=1.0)
+        self._pipeline_threads = []
+        self._pipeline_stop = None
+        logger.info("Tracker pipeline stopped")
+
     def reset_smoothing(self) -> None:
         """Reset all smoothing filters."""
-        for smoother in self._smoothers:
-            smoother.reset()
+        self._ema_state = None
         logger.debug("Smoothing filters reset")
     
     def __enter__(self) -> HandTracker:
@@ -8,12 +8,34 @@ Handles dead zones, sensitivity, and screen boundary enforcement.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Tuple, Optional, NamedTuple
 from dataclasses import dataclass
 from enum import Enum, auto
 
 logger = logging.getLogger(__name__)
 
+# ctypes type construction is expensive, so the user32 handle and the
+# EnumDisplayMonitors callback type are built once at import rather
+# than inside every call
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.windll.user32
+    _user32.GetSystemMetrics.argtypes = (ctypes.c_int,)
+    _user32.GetSystemMetrics.restype = ctypes.c_int
+    _MonitorEnumProc = ctypes.WINFUNCTYPE(
+        ctypes.c_bool,
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(wintypes.RECT),
+        ctypes.c_double,
+    )
+else:  # pragma: no cover - non-Windows development hosts
+    _user32 = None
+    _MonitorEnumProc = None
+
 
 class ScreenZone(Enum):
     """Screen zones for zone-based actions."""
@@ -34,7 +56,16 @@ class ScreenPoint(NamedTuple):
     y: int
 
 
-@dataclass
+# Row-major 3x3 zone table, built once at import instead of per
+# get_zone call
+_ZONE_MAP: Tuple[ScreenZone, ...] = (
+    ScreenZone.TOP_LEFT, ScreenZone.TOP_CENTER, ScreenZone.TOP_RIGHT,
+    ScreenZone.MIDDLE_LEFT, ScreenZone.MIDDLE_CENTER, ScreenZone.MIDDLE_RIGHT,
+    ScreenZone.BOTTOM_LEFT, ScreenZone.BOTTOM_CENTER, ScreenZone.BOTTOM_RIGHT,
+)
+
+
+@dataclass(slots=True)
 class ZoneConfig:
     """Zone mapper configuration.
     
@@ -88,7 +119,15 @@ class ZoneMapper:
         >>> screen_pos = mapper.map_position((0.5, 0.5))
         >>> print(screen_pos)  # ScreenPoint(x=960, y=540)
     """
-    
+
+    __slots__ = (
+        'config', '_last_position', '_last_norm', '_center',
+        '_sx', '_bx', '_sy', '_by',
+        '_min_x', '_max_x', '_min_y', '_max_y',
+        '_smooth', '_smooth_inv', '_dead_zone', '_invert_x',
+        '_zone_cols', '_zone_rows', '_map_fn',
+    )
+
     def __init__(self, config: Optional[ZoneConfig] = None) -> None:
         """Initialize zone mapper.
         
@@ -97,8 +136,13 @@ class ZoneMapper:
         """
         self.config = config or ZoneConfig()
         self._last_position: Optional[ScreenPoint] = None
+        # Normalized position of the last accepted mapping; the
+        # dead-zone test compares against this directly instead of
+        # back-converting the pixel position
+        self._last_norm: Optional[Tuple[float, float]] = None
         self._center = (0.5, 0.5)
-        
+        self._recompute_transform()
+
         logger.info(
             "ZoneMapper initialized: screen=%dx%d, sensitivity=%.2f, dead_zone=%.3f",
             self.config.screen_width,
@@ -126,56 +170,129 @@ class ZoneMapper:
         """
         self.config.screen_width = width
         self.config.screen_height = height
+        self._recompute_transform()
         logger.info("Screen size updated: %dx%d", width, height)
-    
+
+    def _recompute_transform(self) -> None:
+        """Fold the mapping pipeline into one affine per axis.
+
+        Inversion, sensitivity scaling about the center, and the
+        screen-size multiply compose into screen = scale*n + bias; the
+        normalized clamp and margin clamp collapse into one pixel
+        bound. Recomputed whenever the config changes so map_position
+        is two multiply-adds and two clamps per call.
+        """
+        cfg = self.config
+        width, height = cfg.screen_width, cfg.screen_height
+        sens = cfg.sensitivity
+
+        ax = -1.0 if cfg.invert_x else 1.0
+        cx = 1.0 if cfg.invert_x else 0.0
+        ay = -1.0 if cfg.invert_y else 1.0
+        cy = 1.0 if cfg.invert_y else 0.0
+
+        self._sx = width * sens * ax
+        self._bx = width * (0.5 + (cx - 0.5) * sens)
+        self._sy = height * sens * ay
+        self._by = height * (0.5 + (cy - 0.5) * sens)
+
+        self._min_x = float(cfg.margin)
+        self._max_x = float(width - cfg.margin)
+        self._min_y = float(cfg.margin)
+        self._max_y = float(height - cfg.margin)
+
+        self._smooth = cfg.smoothing
+        self._smooth_inv = 1.0 - cfg.smoothing
+        self._dead_zone = cfg.dead_zone
+        self._invert_x = cfg.invert_x
+        self._zone_cols = cfg.zone_columns
+        self._zone_rows = cfg.zone_rows
+        self._map_fn = self._compile_mapper()
+
+    def _compile_mapper(self):
+        """Build a mapping closure specialized to the current config.
+
+        Partial evaluation without exec: the affine constants and
+        clamp bounds bind as default arguments (locals, not attribute
+        loads), and the smoothing variant is only compiled in when
+        smoothing is enabled, so the common path carries no dead
+        branches.
+
+        Returns:
+            Callable (x, y, last) -> (screen_x, screen_y) floats
+        """
+        if self._smooth > 0.0:
+            def _map(
+                x, y, last,
+                sx=self._sx, bx=self._bx, sy=self._sy, by=self._by,
+                min_x=self._min_x, max_x=self._max_x,
+                min_y=self._min_y, max_y=self._max_y,
+                smooth=self._smooth, smooth_inv=self._smooth_inv,
+            ):
+                screen_x = sx * x + bx
+                screen_y = sy * y + by
+                if screen_x < min_x:
+                    screen_x = min_x
+                elif screen_x > max_x:
+                    screen_x = max_x
+                if screen_y < min_y:
+                    screen_y = min_y
+                elif screen_y > max_y:
+                    screen_y = max_y
+                if last is not None:
+                    screen_x = smooth_inv * screen_x + smooth * last.x
+                    screen_y = smooth_inv * screen_y + smooth * last.y
+                return screen_x, screen_y
+        else:
+            def _map(
+                x, y, last,
+                sx=self._sx, bx=self._bx, sy=self._sy, by=self._by,
+                min_x=self._min_x, max_x=self._max_x,
+                min_y=self._min_y, max_y=self._max_y,
+            ):
+                screen_x = sx * x + bx
+                screen_y = sy * y + by
+                if screen_x < min_x:
+                    screen_x = min_x
+                elif screen_x > max_x:
+                    screen_x = max_x
+                if screen_y < min_y:
+                    screen_y = min_y
+                elif screen_y > max_y:
+                    screen_y = max_y
+                return screen_x, screen_y
+        return _map
+
     def map_position(
-        self, 
+        self,
         normalized_pos: Tuple[float, float]
     ) -> ScreenPoint:
         """Map normalized coordinates to screen pixels.
-        
+
         Args:
             normalized_pos: Position as (x, y) in range 0-1
-            
+
         Returns:
             Screen position in pixels
         """
         x, y = normalized_pos
-        
-        # Apply inversion (mirroring)
-        if self.config.invert_x:
-            x = 1.0 - x
-        if self.config.invert_y:
-            y = 1.0 - y
-        
-        # Apply sensitivity
-        if self.config.sensitivity != 1.0:
-            # Scale around center
-            x = 0.5 + (x - 0.5) * self.config.sensitivity
-            y = 0.5 + (y - 0.5) * self.config.sensitivity
-        
-        # Clamp to valid range
-        x = max(0.0, min(1.0, x))
-        y = max(0.0, min(1.0, y))
-        
-        # Map to screen coordinates
-        screen_x = int(x * self.config.screen_width)
-        screen_y = int(y * self.config.screen_height)
-        
-        # Apply margin constraints
-        margin = self.config.margin
-        screen_x = max(margin, min(self.config.screen_width - margin, screen_x))
-        screen_y = max(margin, min(self.config.screen_height - margin, screen_y))
-        
-        # Optional smoothing
-        if self.config.smoothing > 0 and self._last_position:
-            alpha = 1.0 - self.config.smoothing
-            screen_x = int(alpha * screen_x + self.config.smoothing * self._last_position.x)
-            screen_y = int(alpha * screen_y + self.config.smoothing * self._last_position.y)
-        
-        position = ScreenPoint(x=screen_x, y=screen_y)
+
+        # Hover inside the dead zone returns the anchored position
+        # without touching the affine at all
+        last_norm = self._last_norm
+        if last_norm is not None and self._last_position is not None:
+            dz = self._dead_zone
+            if abs(x - last_norm[0]) < dz and abs(y - last_norm[1]) < dz:
+                return self._last_position
+
+        # Specialized affine + clamp (+ smoothing when configured),
+        # compiled once per config in _compile_mapper
+        screen_x, screen_y = self._map_fn(x, y, self._last_position)
+
+        position = ScreenPoint(x=int(screen_x), y=int(screen_y))
         self._last_position = position
-        
+        self._last_norm = normalized_pos
+
         return position
     
     def is_in_dead_zone(
@@ -193,18 +310,16 @@ class ZoneMapper:
             True if within dead zone
         """
         if reference_pos is None:
-            if self._last_position is None:
+            # The normalized anchor is maintained by map_position, so
+            # no pixel-to-normalized back-conversion is needed
+            reference_pos = self._last_norm
+            if reference_pos is None:
                 return False
-            # Convert last screen position back to normalized
-            reference_pos = (
-                self._last_position.x / self.config.screen_width,
-                self._last_position.y / self.config.screen_height
-            )
-        
+
         dx = abs(normalized_pos[0] - reference_pos[0])
         dy = abs(normalized_pos[1] - reference_pos[1])
-        
-        return dx < self.config.dead_zone and dy < self.config.dead_zone
+
+        return dx < self._dead_zone and dy < self._dead_zone
     
     def get_zone(self, normalized_pos: Tuple[float, float]) -> ScreenZone:
         """Get the screen zone for a position.
@@ -216,27 +331,25 @@ class ZoneMapper:
             ScreenZone enum value
         """
         x, y = normalized_pos
-        
+
         # Apply inversion for consistent zone detection
-        if self.config.invert_x:
+        if self._invert_x:
             x = 1.0 - x
-        
-        # Determine column (0, 1, 2)
-        col = min(int(x * self.config.zone_columns), self.config.zone_columns - 1)
-        
-        # Determine row (0, 1, 2)
-        row = min(int(y * self.config.zone_rows), self.config.zone_rows - 1)
-        
-        # Map to zone enum
-        zone_index = row * self.config.zone_columns + col
-        
-        zone_map = [
-            ScreenZone.TOP_LEFT, ScreenZone.TOP_CENTER, ScreenZone.TOP_RIGHT,
-            ScreenZone.MIDDLE_LEFT, ScreenZone.MIDDLE_CENTER, ScreenZone.MIDDLE_RIGHT,
-            ScreenZone.BOTTOM_LEFT, ScreenZone.BOTTOM_CENTER, ScreenZone.BOTTOM_RIGHT,
-        ]
-        
-        return zone_map[zone_index] if zone_index < len(zone_map) else ScreenZone.MIDDLE_CENTER
+
+        cols = self._zone_cols
+
+        # Branchless edge fold: x == 1.0 lands in the last column/row
+        # (bools subtract as 0/1, replacing the min() calls)
+        col = int(x * cols)
+        col -= (col == cols)
+        row = int(y * self._zone_rows)
+        row -= (row == self._zone_rows)
+
+        zone_index = row * cols + col
+
+        if 0 <= zone_index < len(_ZONE_MAP):
+            return _ZONE_MAP[zone_index]
+        return ScreenZone.MIDDLE_CENTER
     
     def get_edge_proximity(
         self, 
@@ -268,6 +381,7 @@ class ZoneMapper:
     def reset(self) -> None:
         """Reset mapper state."""
         self._last_position = None
+        self._last_norm = None
         logger.debug("Zone mapper reset")
 
 
@@ -278,10 +392,10 @@ def get_screen_size() -> Tuple[int, int]:
         Tuple of (width, height) in pixels
     """
     try:
-        import ctypes
-        user32 = ctypes.windll.user32
-        width = user32.GetSystemMetrics(0)
-        height = user32.GetSystemMetrics(1)
+        if _user32 is None:
+            raise OSError("user32 unavailable on this platform")
+        width = _user32.GetSystemMetrics(0)
+        height = _user32.GetSystemMetrics(1)
         return (width, height)
     except Exception as e:
         logger.warning("Could not get screen size: %s, using default", e)
@@ -296,9 +410,9 @@ def get_multi_monitor_info() -> list[dict]:
     """
     monitors = []
     try:
-        import ctypes
-        from ctypes import wintypes
-        
+        if _MonitorEnumProc is None:
+            raise OSError("monitor enumeration unavailable on this platform")
+
         def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
             monitors.append({
                 "handle": hMonitor,
@@ -308,19 +422,9 @@ def get_multi_monitor_info() -> list[dict]:
                 "bottom": lprcMonitor.contents.bottom,
             })
             return True
-        
-        MonitorEnumProc = ctypes.WINFUNCTYPE(
-            ctypes.c_bool,
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(ctypes.c_int),
-            ctypes.POINTER(wintypes.RECT),
-            ctypes.c_double,
-        )
-        
-        ctypes.windll.user32.EnumDisplayMonitors(
-            None, None, MonitorEnumProc(callback), 0
-        )
+
+        _user32.EnumDisplayMonitors(None, None, _MonitorEnumProc(callback), 0)
     except Exception as e:
         logger.warning("Could not enumerate monitors: %s", e)
-    
+
     return monitors
@@ -10,6 +10,8 @@ from __future__ import annotations
 import sys
 import signal
 import time
+import queue
+import threading
 import argparse
 import json
 from pathlib import Path
@@ -24,8 +26,26 @@ from spatial_touch.core.zone_mapper import ZoneMapper, ZoneConfig, get_screen_si
 from spatial_touch.core.action_dispatcher import ActionDispatcher, ActionConfig
 from spatial_touch.utils.logger import setup_logging, get_logger, PerformanceLogger
 
+# orjson parses several times faster than the stdlib; the API server
+# already depends on it, but the core CLI must run without it
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Parsed settings.json cache keyed by file identity (mtime + size).
+# Repeated loads of an unchanged file — e.g. API-driven config
+# reloads — skip the disk read and JSON decode; the dataclasses are
+# still built fresh so callers may mutate their copy freely.
+_config_json_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# Gestures that drive the cursor; built once instead of a fresh
+# tuple per membership test in _handle_gesture
+_MOVE_GESTURES = frozenset((GestureType.CURSOR_MOVE, GestureType.DRAG_MOVE))
+
 
 @dataclass
 class AppConfig:
@@ -68,10 +88,18 @@ class AppConfig:
         if not config_path.exists():
             logger.warning("Config file not found: %s, using defaults", path)
             return cls.default()
-        
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
+
+        stat = config_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cache_id = str(config_path)
+        cached = _config_json_cache.get(cache_id)
+        if cached is not None and cached[0] == key:
+            data = cached[1]
+        else:
+            # read_bytes + loads skips the text-mode decode layer
+            data = _json_loads(config_path.read_bytes())
+            _config_json_cache[cache_id] = (key, data)
+
         return cls(
             camera=CameraConfig.from_dict(data.get("camera", {})),
             tracking=TrackerConfig.from_dict(data.get("tracking", {})),
@@ -144,12 +172,28 @@ class SpatialTouchController:
         self._paused = False
         self._frame_count = 0
         self._idle_frame_count = 0
+
+        # Pipeline stages (see _main_loop): capture, tracking, and
+        # dispatch overlap across threads, connected by small bounded
+        # queues so a stalled stage drops frames instead of adding lag
+        self._frame_q: queue.Queue = queue.Queue(maxsize=2)
+        self._hand_q: queue.Queue = queue.Queue(maxsize=2)
+        self._workers: list[threading.Thread] = []
+        # Set by the signal handler; checked by the capture loop so
+        # teardown runs in normal context, never inside the handler
+        self._stop_event = threading.Event()
+        # Frames evicted from full queues — the deliberate
+        # drop-late-frames policy, surfaced as a metric
+        self._dropped_frames = 0
         
         # Performance tracking
         self._perf_capture = PerformanceLogger("capture")
         self._perf_tracking = PerformanceLogger("tracking")
         self._perf_gesture = PerformanceLogger("gesture")
         self._perf_total = PerformanceLogger("total")
+        # Instrumentation only pays its way when the stats are read;
+        # outside debug logging, skip the perf_counter calls entirely
+        self._perf_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # Callbacks
         self._on_gesture_callbacks: list[Callable[[Gesture], None]] = []
@@ -171,7 +215,26 @@ class SpatialTouchController:
     def frame_count(self) -> int:
         """Get total frames processed."""
         return self._frame_count
-    
+
+    @property
+    def status_snapshot(self) -> dict:
+        """Read all status fields in one call.
+
+        Returns:
+            Dict with running/paused/tracking/camera/fps/frame-count fields
+        """
+        camera = self._camera
+        tracker = self._tracker
+        return {
+            "running": self._running,
+            "paused": self._paused,
+            "tracking_active": bool(tracker and tracker.is_running),
+            "camera_connected": bool(camera and camera.state == CameraState.CONNECTED),
+            "fps_actual": camera.fps if camera else 0.0,
+            "frame_count": self._frame_count,
+            "gestures_detected": 0,  # TODO: Add gesture counter
+        }
+
     def on_gesture(self, callback: Callable[[Gesture], None]) -> None:
         """Register gesture callback.
         
@@ -203,22 +266,42 @@ class SpatialTouchController:
         try:
             self._initialize_components()
             self._running = True
-            
-            # Setup signal handlers
-            signal.signal(signal.SIGINT, self._signal_handler)
-            signal.signal(signal.SIGTERM, self._signal_handler)
-            
+            self._stop_event.clear()
+
+            # Setup signal handlers; CPython only allows this on the
+            # main thread, and callers like the API server start the
+            # controller from a worker thread
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGINT, self._signal_handler)
+                signal.signal(signal.SIGTERM, self._signal_handler)
+
             logger.info("Spatial Touch started successfully")
-            
+
             if blocking:
                 self._main_loop()
-            
+                # A signal exits the loop via the stop event; finish
+                # the teardown in normal (non-handler) context
+                self.stop()
+
         except Exception as e:
             logger.error("Failed to start: %s", e)
             self._notify_error(e)
             self.stop()
             raise
     
+    def run(self) -> None:
+        """Run the processing loop on the calling thread until stopped.
+
+        For callers that start with blocking=False and want to own the
+        loop thread themselves (e.g. the API server's controller
+        worker). Returns after stop() is called from any thread.
+        """
+        if not self._running:
+            logger.warning("Controller not started")
+            return
+        self._main_loop()
+        self.stop()
+
     def stop(self) -> None:
         """Stop the controller."""
         if not self._running:
@@ -226,7 +309,13 @@ class SpatialTouchController:
         
         logger.info("Stopping Spatial Touch...")
         self._running = False
-        
+        self._stop_event.set()
+
+        # Drain the pipeline before tearing down the components it
+        # uses; join skips the calling thread so a worker (e.g. the
+        # camera error callback) can initiate the stop
+        self._shutdown_workers()
+
         self._cleanup_components()
         
         # Log performance stats
@@ -304,75 +393,203 @@ class SpatialTouchController:
         logger.debug("Components cleaned up")
     
     def _main_loop(self) -> None:
-        """Main processing loop."""
+        """Main processing loop, pipelined across three stages.
+
+        Capture runs on the calling thread (it owns the frame-rate
+        pacing and the signal handlers); tracking and dispatch run on
+        worker threads. Stages overlap, so throughput is bounded by
+        the slowest stage instead of the sum of all of them, and the
+        bounded queues drop stale frames rather than letting latency
+        accumulate.
+        """
         logger.debug("Entering main loop...")
-        
+
+        # Fresh queues each run: a previous run may have left its
+        # shutdown sentinel behind
+        self._frame_q = queue.Queue(maxsize=2)
+        self._hand_q = queue.Queue(maxsize=2)
+        self._workers = [
+            threading.Thread(
+                target=self._tracking_worker,
+                name="TrackingWorker",
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._dispatch_worker,
+                name="DispatchWorker",
+                daemon=True
+            ),
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._capture_loop()
+        self._shutdown_workers()
+
+        logger.debug("Exited main loop")
+
+    def _enqueue_latest(self, q: queue.Queue, item) -> None:
+        """Put item on a bounded queue, dropping the oldest if full.
+
+        Deliberate policy: when a stage falls behind, stale work is
+        evicted so the pipeline always operates on the freshest data
+        and latency stays bounded — a slow consumer sees frames
+        skipped, never a growing backlog. Evictions are counted for
+        the shutdown stats.
+        """
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                    self._dropped_frames += 1
+                except queue.Empty:
+                    pass
+
+    def _capture_loop(self) -> None:
+        """Stage 1: paced frame capture feeding the tracking queue."""
         target_interval = 1.0 / self.config.active_fps
         idle_interval = 1.0 / self.config.idle_fps
-        
-        while self._running:
-            loop_start = time.perf_counter()
-            
+        # Local bindings: these run every loop iteration
+        _perf_counter = time.perf_counter
+        _sleep = time.sleep
+
+        perf_enabled = self._perf_enabled
+        # Deadline pacing: each iteration advances a fixed schedule
+        # instead of sleeping (interval - elapsed), so OS scheduler
+        # jitter doesn't accumulate into uneven frame cadence
+        deadline = _perf_counter()
+
+        while self._running and not self._stop_event.is_set():
             try:
-                self._perf_total.start()
-                
-                if not self._paused:
-                    self._process_frame()
-                
-                self._perf_total.end(log=False)
-                
+                if perf_enabled:
+                    self._perf_total.start()
+
+                if (not self._paused and self._camera is not None
+                        and self._tracker is not None):
+                    # Ping-pong handoff: the RGB conversion writes
+                    # straight into the tracker's current write slot,
+                    # then the swap publishes a read-only view — no
+                    # per-frame copy. A frame is overwritten only
+                    # after two further swaps, i.e. once the queue has
+                    # already dropped it.
+                    if perf_enabled:
+                        self._perf_capture.start()
+                    shape = self._camera.shape
+                    frame = None
+                    if shape is not None:
+                        buf = self._tracker.acquire_write_buffer(shape)
+                        frame = self._camera.get_frame_rgb(out=buf)
+                    if perf_enabled:
+                        self._perf_capture.end(log=False)
+
+                    if frame is not None:
+                        self._enqueue_latest(
+                            self._frame_q,
+                            self._tracker.swap_write_buffer()
+                        )
+
+                if perf_enabled:
+                    self._perf_total.end(log=False)
+
                 # Adaptive frame rate
                 is_idle = self._idle_frame_count > self.config.idle_timeout_frames
                 interval = idle_interval if is_idle else target_interval
-                
-                # Frame rate limiting
-                elapsed = time.perf_counter() - loop_start
-                sleep_time = interval - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                    
+
+                # Frame rate limiting against the schedule; a stall
+                # beyond 100 ms resets the deadline rather than
+                # bursting frames to catch up
+                deadline += interval
+                now = _perf_counter()
+                if deadline < now - 0.1:
+                    deadline = now
+                elif deadline > now:
+                    _sleep(deadline - now)
+
             except Exception as e:
                 logger.error("Error in main loop: %s", e)
                 self._notify_error(e)
-        
-        logger.debug("Exited main loop")
-    
-    def _process_frame(self) -> None:
-        """Process a single frame."""
-        if not all([self._camera, self._tracker, self._gesture_engine, 
-                    self._zone_mapper, self._dispatcher]):
-            return
-        
-        # Capture frame
-        self._perf_capture.start()
-        frame = self._camera.get_frame_rgb()
-        self._perf_capture.end(log=False)
-        
-        if frame is None:
-            return
-        
-        self._frame_count += 1
-        
-        # Track hand
-        self._perf_tracking.start()
-        hand = self._tracker.process(frame)
-        self._perf_tracking.end(log=False)
-        
-        # Update idle counter
-        if not hand.is_valid:
-            self._idle_frame_count += 1
+
+    def _tracking_worker(self) -> None:
+        """Stage 2: hand tracking on captured frames.
+
+        Exits on the None sentinel, forwarding it downstream.
+        """
+        while True:
+            frame = self._frame_q.get()
+            if frame is None:
+                self._enqueue_latest(self._hand_q, None)
+                return
+
+            try:
+                tracker = self._tracker
+                if tracker is None:
+                    continue
+
+                self._frame_count += 1
+
+                if self._perf_enabled:
+                    self._perf_tracking.start()
+                    hand = tracker.process(frame)
+                    self._perf_tracking.end(log=False)
+                else:
+                    hand = tracker.process(frame)
+
+                # Update idle counter
+                if not hand.is_valid:
+                    self._idle_frame_count += 1
+                    continue
+                self._idle_frame_count = 0
+
+                self._enqueue_latest(self._hand_q, hand)
+
+            except Exception as e:
+                logger.error("Error in tracking worker: %s", e)
+                self._notify_error(e)
+
+    def _dispatch_worker(self) -> None:
+        """Stage 3: gesture detection and action dispatch.
+
+        Gesture detection lives here rather than with tracking: the
+        engine reuses its cursor-move gesture instance, so detection
+        and consumption must stay on one thread.
+        """
+        while True:
+            hand = self._hand_q.get()
+            if hand is None:
+                return
+
+            try:
+                engine = self._gesture_engine
+                if engine is None or self._dispatcher is None:
+                    continue
+
+                if self._perf_enabled:
+                    self._perf_gesture.start()
+                    gestures = engine.process(hand)
+                    self._perf_gesture.end(log=False)
+                else:
+                    gestures = engine.process(hand)
+
+                for gesture in gestures:
+                    self._handle_gesture(gesture, hand)
+
+            except Exception as e:
+                logger.error("Error in dispatch worker: %s", e)
+                self._notify_error(e)
+
+    def _shutdown_workers(self) -> None:
+        """Unwind the pipeline: sentinel through the queues, then join."""
+        if not self._workers:
             return
-        else:
-            self._idle_frame_count = 0
-        
-        # Detect gestures
-        self._perf_gesture.start()
-        gestures = self._gesture_engine.process(hand)
-        self._perf_gesture.end(log=False)
-        
-        # Process gestures
-        for gesture in gestures:
-            self._handle_gesture(gesture, hand)
+        self._enqueue_latest(self._frame_q, None)
+        current = threading.current_thread()
+        for worker in self._workers:
+            if worker is not current:
+                worker.join(timeout=1.0)
+        self._workers = []
     
     def _handle_gesture(self, gesture: Gesture, hand: HandData) -> None:
         """Handle detected gesture.
@@ -387,14 +604,18 @@ class SpatialTouchController:
             gesture.metadata["screen_pos"] = (screen_pos.x, screen_pos.y)
             
             # Move cursor for cursor_move and drag gestures
-            if gesture.type in (GestureType.CURSOR_MOVE, GestureType.DRAG_MOVE):
+            if gesture.type in _MOVE_GESTURES:
                 self._dispatcher.move_cursor(screen_pos.x, screen_pos.y)
         
         # Dispatch to action handler
         self._dispatcher.handle_gesture(gesture)
         
-        # Notify callbacks
-        for callback in self._on_gesture_callbacks:
+        # Notify callbacks; none registered is the common CLI case,
+        # so skip the loop setup entirely
+        callbacks = self._on_gesture_callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(gesture)
             except Exception as e:
@@ -411,9 +632,15 @@ class SpatialTouchController:
             self.stop()
     
     def _signal_handler(self, signum, frame) -> None:
-        """Handle system signals."""
+        """Handle system signals.
+
+        Only flags the stop event: joining worker threads or tearing
+        down components from signal context can deadlock with queue
+        operations, so the capture loop notices the flag and unwinds
+        on its own thread.
+        """
         logger.info("Received signal %s, stopping...", signum)
-        self.stop()
+        self._stop_event.set()
     
     def _notify_error(self, error: Exception) -> None:
         """Notify error callbacks.
@@ -421,7 +648,10 @@ class SpatialTouchController:
         Args:
             error: Exception that occurred
         """
-        for callback in self._on_error_callbacks:
+        callbacks = self._on_error_callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(error)
             except Exception as e:
@@ -431,6 +661,10 @@ class SpatialTouchController:
         """Log performance statistics."""
         logger.info("=== Performance Statistics ===")
         logger.info("Total frames: %d", self._frame_count)
+        logger.info("Dropped frames: %d", self._dropped_frames)
+        if not self._perf_enabled:
+            logger.info("Stage timings not collected (debug logging off)")
+            return
         logger.info("Capture: avg=%.2fms", self._perf_capture.average)
         logger.info("Tracking: avg=%.2fms", self._perf_tracking.average)
         logger.info("Gesture: avg=%.2fms", self._perf_gesture.average)
@@ -562,14 +796,20 @@ def main() -> int:
             logger.info("API docs available at http://localhost:%d/docs", args.api_port)
         
         if args.api_only:
-            # API-only mode: just keep the server running
+            # API-only mode: keep the server running until a signal
+            # arrives. The wait is sliced because a bare Event.wait()
+            # cannot be interrupted by Ctrl+C on Windows.
             logger.info("Running in API-only mode. Use Flutter app to control.")
-            import time
-            while True:
-                time.sleep(1)
+            stop_event = threading.Event()
+            signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+            signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+            while not stop_event.wait(timeout=1.0):
+                pass
+            if api_server:
+                api_server.stop()
         else:
             controller.start(blocking=True)
-        
+
         return 0
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
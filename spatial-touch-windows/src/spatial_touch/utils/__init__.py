@@ -1,14 +1,29 @@
 """Utility modules for Spatial Touch."""
 
-from spatial_touch.utils.smoothing import ExponentialMovingAverage, MovingAverage
-from spatial_touch.utils.logger import setup_logging, get_logger
-from spatial_touch.utils.math_helpers import euclidean_distance, normalize_to_range
-
-__all__ = [
-    "ExponentialMovingAverage",
-    "MovingAverage",
-    "setup_logging",
-    "get_logger",
-    "euclidean_distance",
-    "normalize_to_range",
-]
+# Lazy re-exports (PEP 562): importing the package no longer loads
+# every utility module; each is imported the first time one of its
+# names is referenced.
+_EXPORTS = {
+    "ExponentialMovingAverage": "spatial_touch.utils.smoothing",
+    "MovingAverage": "spatial_touch.utils.smoothing",
+    "setup_logging": "spatial_touch.utils.logger",
+    "get_logger": "spatial_touch.utils.logger",
+    "euclidean_distance": "spatial_touch.utils.math_helpers",
+    "normalize_to_range": "spatial_touch.utils.math_helpers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -7,9 +7,13 @@ Supports file and console output with rotation.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -19,8 +23,20 @@ from datetime import datetime
 DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Module-level logger cache
-_loggers: dict[str, logging.Logger] = {}
+# Bound once: the timing paths run per frame and should not pay the
+# sys.modules lookup of an inline import nor the attribute traversal
+_perf_counter = time.perf_counter
+
+# Background drain thread for file logging (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background file-logging listener, if any."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 def setup_logging(
@@ -52,9 +68,14 @@ def setup_logging(
         >>> logger = get_logger(__name__)
         >>> logger.info("Application started")
     """
+    # Resolve the level once for the logger and both handlers
+    level_int = logging.getLevelName(level.upper())
+    if not isinstance(level_int, int):
+        raise ValueError(f"Unknown log level: {level}")
+
     # Get root logger for the package
     root_logger = logging.getLogger("spatial_touch")
-    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.setLevel(level_int)
     
     # Clear existing handlers
     root_logger.handlers.clear()
@@ -68,24 +89,41 @@ def setup_logging(
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setLevel(level_int)
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
     
-    # File handler
+    # File handler, decoupled from callers by a queue: log calls on
+    # the processing threads enqueue records and return, while a
+    # QueueListener thread does the disk I/O and rotation
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         file_handler = logging.handlers.RotatingFileHandler(
             log_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8"
         )
-        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setLevel(level_int)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level_int)
+        root_logger.addHandler(queue_handler)
+
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(shutdown_logging)
     
     # Suppress noisy third-party loggers
     logging.getLogger("mediapipe").setLevel(logging.WARNING)
@@ -107,13 +145,11 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Module initialized")
     """
-    if name not in _loggers:
-        # Ensure it's under our namespace
-        if not name.startswith("spatial_touch"):
-            name = f"spatial_touch.{name}"
-        _loggers[name] = logging.getLogger(name)
-    
-    return _loggers[name]
+    # Ensure it's under our namespace; logging.Manager already caches
+    # loggers by name, thread-safely, so no cache is kept here
+    if not name.startswith("spatial_touch"):
+        name = f"spatial_touch.{name}"
+    return logging.getLogger(name)
 
 
 class PerformanceLogger:
@@ -127,7 +163,12 @@ class PerformanceLogger:
         >>> # ... do work ...
         >>> perf.end()  # Logs duration
     """
-    
+
+    __slots__ = (
+        'operation', 'logger', '_start_time',
+        '_samples', '_max_samples', '_sum', '_sum_sq',
+    )
+
     def __init__(self, operation: str, logger: Optional[logging.Logger] = None) -> None:
         """Initialize performance logger.
         
@@ -138,13 +179,16 @@ class PerformanceLogger:
         self.operation = operation
         self.logger = logger or get_logger("performance")
         self._start_time: Optional[float] = None
-        self._samples: list[float] = []
+        # Ring buffer plus running sum: O(1) append and O(1) average
+        # instead of per-frame list reslicing and O(N) sum()
         self._max_samples = 100
+        self._samples: deque[float] = deque(maxlen=self._max_samples)
+        self._sum = 0.0
+        self._sum_sq = 0.0
     
     def start(self) -> None:
         """Start timing."""
-        import time
-        self._start_time = time.perf_counter()
+        self._start_time = _perf_counter()
     
     def end(self, log: bool = True) -> float:
         """End timing and optionally log.
@@ -155,19 +199,25 @@ class PerformanceLogger:
         Returns:
             Duration in milliseconds
         """
-        import time
-        
         if self._start_time is None:
             return 0.0
-        
-        duration = (time.perf_counter() - self._start_time) * 1000  # ms
+
+        duration = (_perf_counter() - self._start_time) * 1000  # ms
+
+        # Keep the running sums in step with the ring buffer:
+        # subtract the sample the maxlen deque is about to evict
+        if len(self._samples) == self._max_samples:
+            evicted = self._samples[0]
+            self._sum -= evicted
+            self._sum_sq -= evicted * evicted
         self._samples.append(duration)
+        self._sum += duration
+        self._sum_sq += duration * duration
         
-        # Keep only recent samples
-        if len(self._samples) > self._max_samples:
-            self._samples = self._samples[-self._max_samples:]
-        
-        if log:
+        # The isEnabledFor guard matters because of the average
+        # argument: logger.debug would defer the formatting itself,
+        # but the property computes either way
+        if log and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 "%s completed in %.2f ms (avg: %.2f ms)",
                 self.operation,
@@ -183,8 +233,22 @@ class PerformanceLogger:
         """Get average duration in milliseconds."""
         if not self._samples:
             return 0.0
-        return sum(self._samples) / len(self._samples)
+        return self._sum / len(self._samples)
     
+    @property
+    def stddev(self) -> float:
+        """Get standard deviation of durations in milliseconds.
+
+        Free from the running sums — no pass over the samples.
+        """
+        n = len(self._samples)
+        if n == 0:
+            return 0.0
+        mean = self._sum / n
+        # Floating-point cancellation can dip slightly below zero
+        variance = max(self._sum_sq / n - mean * mean, 0.0)
+        return variance ** 0.5
+
     @property
     def min(self) -> float:
         """Get minimum duration."""
@@ -205,6 +269,7 @@ class PerformanceLogger:
             "operation": self.operation,
             "samples": len(self._samples),
             "average_ms": self.average,
+            "stddev_ms": self.stddev,
             "min_ms": self.min,
             "max_ms": self.max,
         }
@@ -218,7 +283,9 @@ class ContextLogger:
         ...     process_frame()
         # Logs: "processing frame completed in X.XX ms"
     """
-    
+
+    __slots__ = ('message', 'logger', 'level', '_start_time')
+
     def __init__(
         self, 
         message: str, 
@@ -239,15 +306,12 @@ class ContextLogger:
     
     def __enter__(self) -> ContextLogger:
         """Enter context."""
-        import time
-        self._start_time = time.perf_counter()
+        self._start_time = _perf_counter()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context and log."""
-        import time
-        
-        duration = (time.perf_counter() - self._start_time) * 1000
+        duration = (_perf_counter() - self._start_time) * 1000
         
         if exc_type:
             self.logger.error(
@@ -6,14 +6,38 @@ Provides mathematical utility functions for gesture detection.
 
 from __future__ import annotations
 
+import functools
 import math
-from typing import Tuple, Sequence, Union
+import struct
+from dataclasses import dataclass
+from typing import List, Tuple, Sequence, Union
+
+import numpy as np
+
+# Optional SIMD-accelerated distance kernels; everything falls back
+# to NumPy when the package is absent
+try:
+    import simsimd
+    _HAS_SIMSIMD = True
+except ImportError:
+    _HAS_SIMSIMD = False
+
+# Batch (NumPy) helpers standardize on float32: landmark data arrives
+# as float32 from MediaPipe, is rounded to integer pixels at the end,
+# and the narrower lanes halve memory traffic. Scalar helpers keep
+# Python's native float64.
 
 # Type aliases
 Point2D = Tuple[float, float]
 Point3D = Tuple[float, float, float]
 PointND = Sequence[float]
 
+# Bound once; the distance helpers run per landmark per frame
+_sqrt = math.sqrt
+_hypot = math.hypot
+_cos = math.cos
+_sin = math.sin
+
 
 def euclidean_distance(point_a: PointND, point_b: PointND) -> float:
     """Calculate Euclidean distance between two points.
@@ -33,10 +57,24 @@ def euclidean_distance(point_a: PointND, point_b: PointND) -> float:
         >>> euclidean_distance((0, 0, 0), (1, 1, 1))
         1.732...
     """
-    if len(point_a) != len(point_b):
+    n = len(point_a)
+    if n != len(point_b):
         raise ValueError("Points must have same dimensions")
-    
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(point_a, point_b)))
+
+    # Unrolled fast paths: 2D and 3D points dominate this codebase,
+    # and inline arithmetic skips the zip/generator machinery
+    if n == 2:
+        return euclidean_distance_2d(point_a[0], point_a[1],
+                                     point_b[0], point_b[1])
+    if n == 3:
+        return euclidean_distance_3d(point_a[0], point_a[1], point_a[2],
+                                     point_b[0], point_b[1], point_b[2])
+
+    total = 0.0
+    for i in range(n):
+        d = point_a[i] - point_b[i]
+        total += d * d
+    return _sqrt(total)
 
 
 def euclidean_distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -49,7 +87,9 @@ def euclidean_distance_2d(x1: float, y1: float, x2: float, y2: float) -> float:
     Returns:
         Euclidean distance
     """
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    # math.hypot does the squaring, summing, and sqrt in one C call
+    # (and is overflow-safe, unlike the manual expansion)
+    return _hypot(x2 - x1, y2 - y1)
 
 
 def euclidean_distance_3d(
@@ -65,7 +105,119 @@ def euclidean_distance_3d(
     Returns:
         Euclidean distance
     """
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
+    # Three-argument hypot has been available since Python 3.8
+    return _hypot(x2 - x1, y2 - y1, z2 - z1)
+
+
+def euclidean_distance_sq_3d(
+    x1: float, y1: float, z1: float,
+    x2: float, y2: float, z2: float
+) -> float:
+    """Calculate squared 3D Euclidean distance.
+
+    Prefer this over euclidean_distance_3d when the result is only
+    compared against a threshold: squaring the threshold instead
+    skips the sqrt entirely.
+
+    Args:
+        x1, y1, z1: First point coordinates
+        x2, y2, z2: Second point coordinates
+
+    Returns:
+        Squared Euclidean distance
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    dz = z2 - z1
+    return dx * dx + dy * dy + dz * dz
+
+
+def within_distance_3d(p1: Point3D, p2: Point3D, threshold: float) -> bool:
+    """Check whether two 3D points lie within a distance threshold.
+
+    Compares squared magnitudes, so no sqrt is taken.
+
+    Args:
+        p1: First point (x, y, z)
+        p2: Second point (x, y, z)
+        threshold: Maximum allowed distance
+
+    Returns:
+        True if the points are at most threshold apart
+    """
+    dx = p2[0] - p1[0]
+    dy = p2[1] - p1[1]
+    dz = p2[2] - p1[2]
+    return dx * dx + dy * dy + dz * dz <= threshold * threshold
+
+
+def euclidean_distances_batch_3d(
+    points: np.ndarray,
+    pairs: np.ndarray
+) -> np.ndarray:
+    """Distances for many point pairs in one vectorized pass.
+
+    One fancy-index subtraction and an einsum reduction replace a
+    Python-level loop of per-pair distance calls — the shape of work
+    the gesture engine does against the (21, 3) landmark array every
+    frame.
+
+    Args:
+        points: (N, 3) array of point coordinates
+        pairs: (K, 2) array of index pairs into points
+
+    Returns:
+        (K,) array of Euclidean distances
+
+    Example:
+        >>> pts = np.array([[0., 0., 0.], [3., 4., 0.]])
+        >>> euclidean_distances_batch_3d(pts, np.array([[0, 1]]))
+        array([5.])
+    """
+    pts = np.asarray(points, dtype=np.float32)
+    idx = np.asarray(pairs)
+    diffs = pts[idx[:, 0]] - pts[idx[:, 1]]
+    return np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+
+
+def euclidean_distance_batch_np(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distances over the last axis of broadcast arrays.
+
+    The general NumPy form: works for any leading shape — a (21, 3)
+    landmark array against another, or against a single broadcast
+    point. einsum reduces the squared differences without
+    materializing an intermediate d*d array.
+
+    Args:
+        a: Array of points, coordinates on the last axis
+        b: Array broadcastable against a
+
+    Returns:
+        Array of distances with the last axis reduced away
+    """
+    d = np.asarray(a, dtype=np.float32) - np.asarray(b, dtype=np.float32)
+    return np.sqrt(np.einsum('...i,...i->...', d, d))
+
+
+def batch_euclidean(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise Euclidean distances between two point batches.
+
+    Uses simsimd's SIMD kernels when the package is installed;
+    otherwise a NumPy norm over the row differences. Both paths
+    return the distance between a[i] and b[i] for each row.
+
+    Args:
+        a: (N, D) array of points
+        b: (N, D) array of points
+
+    Returns:
+        (N,) array of Euclidean distances
+    """
+    a = np.ascontiguousarray(a, dtype=np.float32)
+    b = np.ascontiguousarray(b, dtype=np.float32)
+    if _HAS_SIMSIMD:
+        return np.sqrt(np.asarray(simsimd.sqeuclidean(a, b)))
+    return np.linalg.norm(a - b, axis=-1)
 
 
 def manhattan_distance(point_a: PointND, point_b: PointND) -> float:
@@ -78,7 +230,17 @@ def manhattan_distance(point_a: PointND, point_b: PointND) -> float:
     Returns:
         Manhattan distance
     """
-    return sum(abs(a - b) for a, b in zip(point_a, point_b))
+    n = len(point_a)
+    if n == 2:
+        return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
+    if n == 3:
+        return (abs(point_a[0] - point_b[0])
+                + abs(point_a[1] - point_b[1])
+                + abs(point_a[2] - point_b[2]))
+    total = 0.0
+    for i in range(n):
+        total += abs(point_a[i] - point_b[i])
+    return total
 
 
 def normalize_to_range(
@@ -111,6 +273,44 @@ def normalize_to_range(
     return new_min + normalized * (new_max - new_min)
 
 
+def make_normalize_to_range(
+    old_min: float,
+    old_max: float,
+    new_min: float = 0.0,
+    new_max: float = 1.0
+):
+    """Build a normalize_to_range specialized for fixed ranges.
+
+    Folds both ranges into one scale and offset at construction, so
+    each call is a multiply and an add — no per-call range math or
+    degenerate-range branch. This is the per-frame form of
+    normalize_to_range (e.g. MediaPipe's 0-1 coords to pixels).
+
+    Args:
+        old_min: Original minimum
+        old_max: Original maximum
+        new_min: Target minimum
+        new_max: Target maximum
+
+    Returns:
+        Callable mapping a value from the old range to the new one
+
+    Example:
+        >>> to_px = make_normalize_to_range(0.0, 1.0, 0.0, 1920.0)
+        >>> to_px(0.5)
+        960.0
+    """
+    if old_max == old_min:
+        return lambda value: new_min
+    scale = (new_max - new_min) / (old_max - old_min)
+    offset = new_min - old_min * scale
+
+    def _norm(value: float, scale: float = scale, offset: float = offset) -> float:
+        return value * scale + offset
+
+    return _norm
+
+
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Clamp a value to a range.
     
@@ -191,7 +391,13 @@ def midpoint(p1: PointND, p2: PointND) -> tuple:
     Returns:
         Midpoint coordinates
     """
-    return tuple((a + b) / 2 for a, b in zip(p1, p2))
+    n = len(p1)
+    if n == 2:
+        return ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
+    if n == 3:
+        return ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2,
+                (p1[2] + p2[2]) / 2)
+    return tuple((p1[i] + p2[i]) / 2 for i in range(n))
 
 
 def velocity(
@@ -218,6 +424,68 @@ def velocity(
     )
 
 
+def velocity_into(
+    out: List[float],
+    p1: Point2D,
+    p2: Point2D,
+    dt: float
+) -> None:
+    """Calculate velocity into a caller-owned 2-element buffer.
+
+    Allocation-free variant of velocity for per-frame loops: the
+    caller keeps one scratch list and no tuple is built per call.
+    The single 1/dt also turns the two divides into multiplies.
+
+    Args:
+        out: 2-element mutable sequence to write (vx, vy) into
+        p1: Previous position
+        p2: Current position
+        dt: Time delta in seconds
+    """
+    if dt <= 0:
+        out[0] = 0.0
+        out[1] = 0.0
+        return
+    inv = 1.0 / dt
+    out[0] = (p2[0] - p1[0]) * inv
+    out[1] = (p2[1] - p1[1]) * inv
+
+
+def midpoint_into(out: List[float], p1: PointND, p2: PointND) -> None:
+    """Calculate midpoint into a caller-owned buffer.
+
+    Allocation-free variant of midpoint; writes len(out) components.
+
+    Args:
+        out: Mutable sequence to write the midpoint into
+        p1: First point
+        p2: Second point
+    """
+    for i in range(len(out)):
+        out[i] = (p1[i] + p2[i]) * 0.5
+
+
+def normalize_vector_into(out: List[float], v: PointND) -> None:
+    """Normalize a vector into a caller-owned buffer.
+
+    Allocation-free variant of normalize_vector; writes len(out)
+    components (zeros for a zero vector).
+
+    Args:
+        out: Mutable sequence to write the unit vector into
+        v: Vector to normalize
+    """
+    n = len(out)
+    mag = vector_magnitude(v)
+    if mag == 0:
+        for i in range(n):
+            out[i] = 0.0
+        return
+    inv = 1.0 / mag
+    for i in range(n):
+        out[i] = v[i] * inv
+
+
 def velocity_magnitude(p1: Point2D, p2: Point2D, dt: float) -> float:
     """Calculate velocity magnitude.
     
@@ -244,8 +512,40 @@ def smooth_step(edge0: float, edge1: float, x: float) -> float:
     Returns:
         Smoothly interpolated value (0-1)
     """
-    x = clamp((x - edge0) / (edge1 - edge0), 0.0, 1.0)
-    return x * x * (3 - 2 * x)
+    # Clamp inlined: two compares instead of two function calls
+    t = (x - edge0) / (edge1 - edge0)
+    if t < 0.0:
+        return 0.0
+    if t > 1.0:
+        return 1.0
+    return t * t * (3.0 - 2.0 * t)
+
+
+def make_smooth_step(edge0: float, edge1: float):
+    """Build a smooth_step specialized for fixed edges.
+
+    The reciprocal of the edge span is captured in the closure, so
+    each call is a multiply instead of a division — worth it when the
+    same curve is evaluated every frame.
+
+    Args:
+        edge0: Lower edge
+        edge1: Upper edge
+
+    Returns:
+        Callable mapping x to the smooth-stepped value (0-1)
+    """
+    inv = 1.0 / (edge1 - edge0)
+
+    def _step(x: float, edge0: float = edge0, inv: float = inv) -> float:
+        t = (x - edge0) * inv
+        if t < 0.0:
+            return 0.0
+        if t > 1.0:
+            return 1.0
+        return t * t * (3.0 - 2.0 * t)
+
+    return _step
 
 
 def smoother_step(edge0: float, edge1: float, x: float) -> float:
@@ -259,8 +559,59 @@ def smoother_step(edge0: float, edge1: float, x: float) -> float:
     Returns:
         Smoothly interpolated value (0-1)
     """
-    x = clamp((x - edge0) / (edge1 - edge0), 0.0, 1.0)
-    return x * x * x * (x * (x * 6 - 15) + 10)
+    t = (x - edge0) / (edge1 - edge0)
+    if t < 0.0:
+        return 0.0
+    if t > 1.0:
+        return 1.0
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+@dataclass(frozen=True, slots=True)
+class Rect:
+    """Axis-aligned rectangle with precomputed corner coordinates.
+
+    Caching x1/y1 at construction means contains() is four compares
+    with no per-call edge arithmetic — build the Rect once when
+    hit-testing many points against the same region.
+
+    Attributes:
+        x0: Left edge
+        y0: Top edge
+        x1: Right edge
+        y1: Bottom edge
+    """
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @classmethod
+    def from_xywh(cls, x: float, y: float, w: float, h: float) -> Rect:
+        """Build a Rect from position and size.
+
+        Args:
+            x: Left edge
+            y: Top edge
+            w: Width
+            h: Height
+
+        Returns:
+            Rect with corners precomputed
+        """
+        return cls(x, y, x + w, y + h)
+
+    def contains(self, px: float, py: float) -> bool:
+        """Check if a point is inside the rectangle.
+
+        Args:
+            px: Point x coordinate
+            py: Point y coordinate
+
+        Returns:
+            True if the point is inside (edges inclusive)
+        """
+        return self.x0 <= px <= self.x1 and self.y0 <= py <= self.y1
 
 
 def is_point_in_rect(
@@ -303,8 +654,8 @@ def rotate_point(
     Returns:
         Rotated point (x, y)
     """
-    cos_a = math.cos(angle)
-    sin_a = math.sin(angle)
+    cos_a = _cos(angle)
+    sin_a = _sin(angle)
     
     # Translate to origin
     x = point[0] - center[0]
@@ -318,6 +669,75 @@ def rotate_point(
     return (new_x + center[0], new_y + center[1])
 
 
+# 0.1-degree quantization grid for the memoized rotation path
+_DECIDEG_PER_RAD = 1800.0 / math.pi
+_RAD_PER_DECIDEG = math.pi / 1800.0
+
+
+@functools.lru_cache(maxsize=256)
+def _cos_sin_quant(qangle: int) -> Tuple[float, float]:
+    """cos/sin for an angle quantized to tenths of a degree."""
+    a = qangle * _RAD_PER_DECIDEG
+    return (_cos(a), _sin(a))
+
+
+def rotate_point_quantized(
+    point: Point2D,
+    angle: float,
+    center: Point2D = (0.0, 0.0)
+) -> Point2D:
+    """Rotate a point with the angle snapped to 0.1 degrees.
+
+    cos/sin pairs are memoized per quantized angle, so a slowly
+    changing orientation (hand roll, UI transitions) pays the trig
+    only when the angle moves to a new grid step. Use rotate_point
+    where the exact angle matters.
+
+    Args:
+        point: Point to rotate (x, y)
+        angle: Rotation angle in radians
+        center: Center of rotation
+
+    Returns:
+        Rotated point (x, y)
+    """
+    cos_a, sin_a = _cos_sin_quant(round(angle * _DECIDEG_PER_RAD))
+
+    x = point[0] - center[0]
+    y = point[1] - center[1]
+    return (
+        x * cos_a - y * sin_a + center[0],
+        x * sin_a + y * cos_a + center[1],
+    )
+
+
+def rotate_points_2d(
+    points: np.ndarray,
+    angle: float,
+    center: Point2D = (0.0, 0.0)
+) -> np.ndarray:
+    """Rotate many 2D points around a center in one pass.
+
+    Builds the 2x2 rotation matrix once — one cos/sin total — and
+    applies it with a single matrix multiply, instead of N scalar
+    rotate_point calls.
+
+    Args:
+        points: (N, 2) array of points
+        angle: Rotation angle in radians
+        center: Center of rotation
+
+    Returns:
+        (N, 2) array of rotated points
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    c = math.cos(angle)
+    s = math.sin(angle)
+    rot = np.array([[c, -s], [s, c]], dtype=np.float64)
+    ctr = np.asarray(center, dtype=np.float64)
+    return (pts - ctr) @ rot.T + ctr
+
+
 def vector_magnitude(v: PointND) -> float:
     """Calculate vector magnitude.
     
@@ -327,7 +747,15 @@ def vector_magnitude(v: PointND) -> float:
     Returns:
         Magnitude
     """
-    return math.sqrt(sum(x ** 2 for x in v))
+    n = len(v)
+    if n == 2:
+        return _hypot(v[0], v[1])
+    if n == 3:
+        return _hypot(v[0], v[1], v[2])
+    total = 0.0
+    for x in v:
+        total += x * x
+    return _sqrt(total)
 
 
 def normalize_vector(v: PointND) -> tuple:
@@ -341,10 +769,65 @@ def normalize_vector(v: PointND) -> tuple:
     """
     mag = vector_magnitude(v)
     if mag == 0:
-        return tuple(0.0 for _ in v)
+        return (0.0,) * len(v)
+    if len(v) == 2:
+        return (v[0] / mag, v[1] / mag)
+    if len(v) == 3:
+        return (v[0] / mag, v[1] / mag, v[2] / mag)
     return tuple(x / mag for x in v)
 
 
+_pack_f = struct.Struct('<f').pack
+_unpack_I = struct.Struct('<I').unpack
+_pack_I = struct.Struct('<I').pack
+_unpack_f = struct.Struct('<f').unpack
+
+
+def fast_inv_sqrt(x: float) -> float:
+    """Approximate 1/sqrt(x) via the float32 bit trick.
+
+    The 0x5f3759df magic constant alone is within ~3.4%; the single
+    Newton-Raphson step tightens it to ~0.2% relative error.
+    Intended for smoothing/animation math where a tiny magnitude
+    error is invisible — not for coordinate mapping.
+
+    Args:
+        x: Positive value
+
+    Returns:
+        Approximate inverse square root of x
+    """
+    i = _unpack_I(_pack_f(x))[0]
+    y = _unpack_f(_pack_I(0x5f3759df - (i >> 1)))[0]
+    return y * (1.5 - 0.5 * x * y * y)
+
+
+def normalize_vector_fast(v: PointND) -> tuple:
+    """Normalize a vector using the approximate inverse sqrt.
+
+    Trades ~0.2% relative magnitude error for skipping the sqrt and
+    turning the per-component divides into multiplies. Use where
+    direction matters more than exact unit length; see fast_inv_sqrt.
+
+    Args:
+        v: Vector to normalize
+
+    Returns:
+        Approximately unit-length vector
+    """
+    mag_sq = 0.0
+    for x in v:
+        mag_sq += x * x
+    if mag_sq == 0:
+        return (0.0,) * len(v)
+    inv = fast_inv_sqrt(mag_sq)
+    if len(v) == 2:
+        return (v[0] * inv, v[1] * inv)
+    if len(v) == 3:
+        return (v[0] * inv, v[1] * inv, v[2] * inv)
+    return tuple(x * inv for x in v)
+
+
 def dot_product(v1: PointND, v2: PointND) -> float:
     """Calculate dot product of two vectors.
     
@@ -355,7 +838,15 @@ def dot_product(v1: PointND, v2: PointND) -> float:
     Returns:
         Dot product
     """
-    return sum(a * b for a, b in zip(v1, v2))
+    n = len(v1)
+    if n == 2:
+        return v1[0] * v2[0] + v1[1] * v2[1]
+    if n == 3:
+        return v1[0] * v2[0] + v1[1] * v2[1] + v1[2] * v2[2]
+    total = 0.0
+    for i in range(n):
+        total += v1[i] * v2[i]
+    return total
 
 
 def cross_product_2d(v1: Point2D, v2: Point2D) -> float:
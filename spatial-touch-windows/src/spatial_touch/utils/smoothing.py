@@ -7,10 +7,14 @@ Reduces jitter in landmark positions and cursor movement.
 
 from __future__ import annotations
 
-from typing import Optional, List, Union
-from collections import deque
+from math import pi
+from typing import Optional, List, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
+_TWO_PI = 2.0 * pi
+
 
 @dataclass
 class SmoothingConfig:
@@ -42,6 +46,8 @@ class ExponentialMovingAverage:
         >>> values = [1.0, 1.2, 0.9, 1.1, 1.0]
         >>> smoothed = [ema.update(v) for v in values]
     """
+
+    __slots__ = ('alpha', '_value', '_initialized')
     
     def __init__(self, alpha: float = 0.4) -> None:
         """Initialize EMA smoother.
@@ -99,6 +105,112 @@ class ExponentialMovingAverage:
         self.alpha = alpha
 
 
+class ArrayEMA:
+    """Exponential moving average over a whole array of channels.
+
+    One fused NumPy multiply-add smooths every channel at once —
+    e.g. all 63 coordinates of a hand — instead of one Python-level
+    EMA object per scalar. State and scratch buffers are allocated
+    once; update writes in place.
+
+    Example:
+        >>> ema = ArrayEMA((21, 3), alpha=0.4)
+        >>> smoothed = ema.update(landmarks)  # (21, 3) array
+    """
+
+    __slots__ = ('alpha', '_dtype', '_value', '_scratch', '_initialized')
+
+    def __init__(
+        self,
+        shape: Union[int, Tuple[int, ...]],
+        alpha: float = 0.4,
+        dtype: np.dtype = np.float32
+    ) -> None:
+        """Initialize array EMA smoother.
+
+        float32 is the default: landmark coordinates arrive as
+        float32 from MediaPipe and end up as integer pixels, and the
+        narrower lanes halve the memory traffic of every update.
+
+        Args:
+            shape: Shape of the smoothed array
+            alpha: Smoothing factor (0-1)
+            dtype: Element type of the state buffers
+        """
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha must be between 0 and 1")
+
+        self.alpha = alpha
+        self._dtype = np.dtype(dtype)
+        self._value = np.empty(shape, dtype=self._dtype)
+        self._scratch = np.empty(shape, dtype=self._dtype)
+        self._initialized = False
+
+    @property
+    def value(self) -> Optional[np.ndarray]:
+        """Get current smoothed array (None before the first update)."""
+        return self._value if self._initialized else None
+
+    @property
+    def is_initialized(self) -> bool:
+        """Check if smoother has been initialized."""
+        return self._initialized
+
+    def update(self, new_values) -> np.ndarray:
+        """Update with a new array and get the smoothed result.
+
+        Args:
+            new_values: Array-like of the configured shape
+
+        Returns:
+            Smoothed array (the internal state buffer — copy it if
+            it must survive the next update)
+        """
+        new_values = np.asarray(new_values, dtype=self._dtype)
+        if not self._initialized:
+            np.copyto(self._value, new_values)
+            self._initialized = True
+            return self._value
+
+        np.multiply(self._value, 1.0 - self.alpha, out=self._value)
+        np.multiply(new_values, self.alpha, out=self._scratch)
+        self._value += self._scratch
+        return self._value
+
+    def reset(self) -> None:
+        """Reset smoother state."""
+        self._initialized = False
+
+    def set_alpha(self, alpha: float) -> None:
+        """Update smoothing factor.
+
+        Args:
+            alpha: New smoothing factor (0-1)
+        """
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha must be between 0 and 1")
+        self.alpha = alpha
+
+
+class HandLandmarkSmoother(ArrayEMA):
+    """EMA over the full (21, 3) hand-landmark tensor.
+
+    Example:
+        >>> smoother = HandLandmarkSmoother(alpha=0.4)
+        >>> smoothed = smoother.update(hand.landmarks_xyz)
+    """
+
+    __slots__ = ()
+
+    def __init__(self, alpha: float = 0.4) -> None:
+        """Initialize hand landmark smoother.
+
+        Args:
+            alpha: Smoothing factor (0-1)
+        """
+        super().__init__((21, 3), alpha)
+
+
 class MovingAverage:
     """Simple Moving Average (SMA) smoother.
     
@@ -111,6 +223,8 @@ class MovingAverage:
         >>> smoothed = [ma.update(v) for v in values]
         >>> print(smoothed[-1])  # 3.0 (average of all 5)
     """
+
+    __slots__ = ('window_size', '_buf', '_idx', '_count', '_sum')
     
     def __init__(self, window_size: int = 5) -> None:
         """Initialize moving average smoother.
@@ -120,44 +234,52 @@ class MovingAverage:
         """
         if window_size < 1:
             raise ValueError("Window size must be at least 1")
-        
+
         self.window_size = window_size
-        self._values: deque = deque(maxlen=window_size)
+        # Preallocated ring buffer with a running sum: update is O(1)
+        # with no per-call allocation
+        self._buf = np.zeros(window_size, dtype=np.float64)
+        self._idx = 0
+        self._count = 0
         self._sum = 0.0
-    
+
     @property
     def value(self) -> Optional[float]:
         """Get current smoothed value."""
-        if not self._values:
+        if self._count == 0:
             return None
-        return self._sum / len(self._values)
-    
+        return self._sum / self._count
+
     @property
     def is_full(self) -> bool:
         """Check if window is full."""
-        return len(self._values) == self.window_size
-    
+        return self._count == self.window_size
+
     def update(self, new_value: float) -> float:
         """Update with new value and get smoothed result.
-        
+
         Args:
             new_value: New input value
-            
+
         Returns:
             Smoothed value (average)
         """
-        # Remove oldest value from sum if window is full
-        if len(self._values) == self.window_size:
-            self._sum -= self._values[0]
-        
-        self._values.append(new_value)
-        self._sum += new_value
-        
-        return self._sum / len(self._values)
-    
+        idx = self._idx
+        # The slot being overwritten holds the value leaving the
+        # window (zero while still filling)
+        self._sum += new_value - self._buf[idx]
+        self._buf[idx] = new_value
+        self._idx = (idx + 1) % self.window_size
+        if self._count < self.window_size:
+            self._count += 1
+
+        return self._sum / self._count
+
     def reset(self) -> None:
         """Reset smoother state."""
-        self._values.clear()
+        self._buf[:] = 0.0
+        self._idx = 0
+        self._count = 0
         self._sum = 0.0
 
 
@@ -172,6 +294,9 @@ class DoubleExponentialSmoothing:
         >>> for value in data:
         ...     smoothed = des.update(value)
     """
+
+    __slots__ = ('alpha', 'beta', '_one_minus_alpha', '_one_minus_beta',
+                 '_level', '_trend', '_initialized')
     
     def __init__(self, alpha: float = 0.4, beta: float = 0.1) -> None:
         """Initialize double exponential smoother.
@@ -182,23 +307,26 @@ class DoubleExponentialSmoothing:
         """
         self.alpha = alpha
         self.beta = beta
+        # Complements precomputed once; update only multiplies
+        self._one_minus_alpha = 1.0 - alpha
+        self._one_minus_beta = 1.0 - beta
         self._level: Optional[float] = None
         self._trend: Optional[float] = None
         self._initialized = False
-    
+
     @property
     def value(self) -> Optional[float]:
         """Get current smoothed value."""
         if self._level is None:
             return None
         return self._level + self._trend if self._trend else self._level
-    
+
     def update(self, new_value: float) -> float:
         """Update with new value and get smoothed result.
-        
+
         Args:
             new_value: New input value
-            
+
         Returns:
             Smoothed value
         """
@@ -206,12 +334,17 @@ class DoubleExponentialSmoothing:
             self._level = new_value
             self._trend = 0.0
             self._initialized = True
-        else:
-            prev_level = self._level
-            self._level = self.alpha * new_value + (1 - self.alpha) * (self._level + self._trend)
-            self._trend = self.beta * (self._level - prev_level) + (1 - self.beta) * self._trend
-        
-        return self._level + self._trend
+            return new_value
+
+        # Work on locals: one attribute load each instead of
+        # re-reading self._level/_trend through the update
+        lvl = self._level
+        trn = self._trend
+        new_lvl = self.alpha * new_value + self._one_minus_alpha * (lvl + trn)
+        new_trn = self.beta * (new_lvl - lvl) + self._one_minus_beta * trn
+        self._level = new_lvl
+        self._trend = new_trn
+        return new_lvl + new_trn
     
     def reset(self) -> None:
         """Reset smoother state."""
@@ -234,6 +367,8 @@ class OneEuroFilter:
         >>> for value in data:
         ...     smoothed = filter.update(value, timestamp)
     """
+
+    __slots__ = ('min_cutoff', 'beta', 'd_cutoff', '_x_hat', '_dx_hat', '_last_time')
     
     def __init__(
         self,
@@ -251,153 +386,232 @@ class OneEuroFilter:
         self.min_cutoff = min_cutoff
         self.beta = beta
         self.d_cutoff = d_cutoff
-        
-        self._x_filter: Optional[ExponentialMovingAverage] = None
-        self._dx_filter: Optional[ExponentialMovingAverage] = None
-        self._last_value: Optional[float] = None
+
+        # Flat scalar state: no per-stage EMA objects to construct,
+        # re-alpha, and call through on every sample
+        self._x_hat = 0.0
+        self._dx_hat = 0.0
         self._last_time: Optional[float] = None
-    
-    def _alpha(self, cutoff: float, dt: float) -> float:
-        """Calculate alpha from cutoff frequency and time delta."""
-        import math
-        tau = 1.0 / (2.0 * math.pi * cutoff)
-        return 1.0 / (1.0 + tau / dt)
-    
+
     def update(self, value: float, timestamp: float) -> float:
         """Update filter with new value.
-        
+
         Args:
             value: New input value
             timestamp: Current timestamp in seconds
-            
+
         Returns:
             Filtered value
         """
         if self._last_time is None:
             # First update
-            self._last_value = value
+            self._x_hat = value
+            self._dx_hat = 0.0
             self._last_time = timestamp
-            self._x_filter = ExponentialMovingAverage(alpha=0.5)
-            self._dx_filter = ExponentialMovingAverage(alpha=0.5)
             return value
-        
+
         dt = timestamp - self._last_time
         if dt <= 0:
-            return self._last_value
-        
-        # Estimate derivative
-        dx = (value - self._last_value) / dt
-        
-        # Filter derivative
-        d_alpha = self._alpha(self.d_cutoff, dt)
-        self._dx_filter.set_alpha(d_alpha)
-        dx_hat = self._dx_filter.update(dx)
-        
+            return self._x_hat
+
+        # Smooth the derivative estimate; alpha folds the usual
+        # tau = 1 / (2*pi*cutoff) into a single expression
+        dx = (value - self._x_hat) / dt
+        d_alpha = dt / (dt + 1.0 / (_TWO_PI * self.d_cutoff))
+        self._dx_hat += d_alpha * (dx - self._dx_hat)
+
         # Adaptive cutoff based on velocity
-        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
-        
+        cutoff = self.min_cutoff + self.beta * abs(self._dx_hat)
+
         # Filter value
-        x_alpha = self._alpha(cutoff, dt)
-        self._x_filter.set_alpha(x_alpha)
-        x_hat = self._x_filter.update(value)
-        
-        self._last_value = x_hat
+        x_alpha = dt / (dt + 1.0 / (_TWO_PI * cutoff))
+        self._x_hat += x_alpha * (value - self._x_hat)
         self._last_time = timestamp
-        
-        return x_hat
-    
+
+        return self._x_hat
+
     def reset(self) -> None:
         """Reset filter state."""
-        self._x_filter = None
-        self._dx_filter = None
-        self._last_value = None
+        self._x_hat = 0.0
+        self._dx_hat = 0.0
         self._last_time = None
 
 
 class Point2DSmoother:
     """Smooths 2D point coordinates.
-    
-    Applies smoothing independently to X and Y coordinates.
-    
+
+    Applies smoothing independently to X and Y coordinates. The EMA
+    path keeps flat scalar state and inlines both updates — no
+    per-axis smoother objects, no method calls per sample.
+
     Example:
         >>> smoother = Point2DSmoother(alpha=0.4)
         >>> smoothed_x, smoothed_y = smoother.update(x, y)
     """
-    
+
+    __slots__ = ('_use_ema', '_a', '_ma', '_sx', '_sy', '_init',
+                 '_x_smoother', '_y_smoother')
+
     def __init__(
-        self, 
+        self,
         alpha: float = 0.4,
         smoother_type: str = "ema"
     ) -> None:
         """Initialize 2D point smoother.
-        
+
         Args:
             alpha: Smoothing factor
             smoother_type: "ema" or "moving_average"
         """
-        if smoother_type == "ema":
-            self._x_smoother = ExponentialMovingAverage(alpha)
-            self._y_smoother = ExponentialMovingAverage(alpha)
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha must be between 0 and 1")
+
+        self._use_ema = smoother_type == "ema"
+        if self._use_ema:
+            self._a = alpha
+            self._ma = 1.0 - alpha
+            self._sx = 0.0
+            self._sy = 0.0
+            self._init = False
         else:
             self._x_smoother = MovingAverage(int(1 / alpha))
             self._y_smoother = MovingAverage(int(1 / alpha))
-    
+
     def update(self, x: float, y: float) -> tuple[float, float]:
         """Update with new coordinates.
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
-            
+
         Returns:
             Tuple of smoothed (x, y)
         """
-        return (
-            self._x_smoother.update(x),
-            self._y_smoother.update(y)
-        )
-    
+        if not self._use_ema:
+            return (
+                self._x_smoother.update(x),
+                self._y_smoother.update(y)
+            )
+
+        if not self._init:
+            self._sx = x
+            self._sy = y
+            self._init = True
+            return (x, y)
+
+        a = self._a
+        ma = self._ma
+        sx = a * x + ma * self._sx
+        sy = a * y + ma * self._sy
+        self._sx = sx
+        self._sy = sy
+        return (sx, sy)
+
     def reset(self) -> None:
         """Reset smoother state."""
-        self._x_smoother.reset()
-        self._y_smoother.reset()
+        if self._use_ema:
+            self._init = False
+        else:
+            self._x_smoother.reset()
+            self._y_smoother.reset()
 
 
 class Point3DSmoother:
     """Smooths 3D point coordinates.
-    
-    Applies smoothing independently to X, Y, and Z coordinates.
+
+    Applies smoothing independently to X, Y, and Z coordinates,
+    with the three EMAs fused into one flat scalar update.
     """
-    
+
+    __slots__ = ('_a', '_ma', '_sx', '_sy', '_sz', '_init')
+
     def __init__(self, alpha: float = 0.4) -> None:
         """Initialize 3D point smoother.
-        
+
         Args:
             alpha: Smoothing factor
         """
-        self._x_smoother = ExponentialMovingAverage(alpha)
-        self._y_smoother = ExponentialMovingAverage(alpha)
-        self._z_smoother = ExponentialMovingAverage(alpha)
-    
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError("Alpha must be between 0 and 1")
+
+        self._a = alpha
+        self._ma = 1.0 - alpha
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sz = 0.0
+        self._init = False
+
     def update(self, x: float, y: float, z: float) -> tuple[float, float, float]:
         """Update with new coordinates.
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
             z: Z coordinate
-            
+
         Returns:
             Tuple of smoothed (x, y, z)
         """
-        return (
-            self._x_smoother.update(x),
-            self._y_smoother.update(y),
-            self._z_smoother.update(z)
-        )
-    
+        if not self._init:
+            self._sx = x
+            self._sy = y
+            self._sz = z
+            self._init = True
+            return (x, y, z)
+
+        a = self._a
+        ma = self._ma
+        sx = a * x + ma * self._sx
+        sy = a * y + ma * self._sy
+        sz = a * z + ma * self._sz
+        self._sx = sx
+        self._sy = sy
+        self._sz = sz
+        return (sx, sy, sz)
+
+    def update_batch(self, xyz: np.ndarray) -> np.ndarray:
+        """Smooth a time-ordered batch of (x, y, z) samples.
+
+        Equivalent to calling update row by row, but runs the fused
+        recursion over a preallocated output array with no tuple
+        built or method dispatched per sample. State advances to the
+        last row, so scalar and batch updates can be interleaved.
+
+        Args:
+            xyz: (N, 3) array of samples in time order
+
+        Returns:
+            (N, 3) array of smoothed samples
+        """
+        xyz = np.asarray(xyz, dtype=np.float64)
+        out = np.empty_like(xyz)
+        if xyz.shape[0] == 0:  # e.g. a frame with no landmarks
+            return out
+        a = self._a
+        ma = self._ma
+        start = 0
+        if not self._init:
+            sx, sy, sz = xyz[0]
+            out[0] = xyz[0]
+            self._init = True
+            start = 1
+        else:
+            sx = self._sx
+            sy = self._sy
+            sz = self._sz
+        for i in range(start, xyz.shape[0]):
+            x, y, z = xyz[i]
+            sx = a * x + ma * sx
+            sy = a * y + ma * sy
+            sz = a * z + ma * sz
+            out[i, 0] = sx
+            out[i, 1] = sy
+            out[i, 2] = sz
+        self._sx = sx
+        self._sy = sy
+        self._sz = sz
+        return out
+
     def reset(self) -> None:
         """Reset smoother state."""
-        self._x_smoother.reset()
-        self._y_smoother.reset()
-        self._z_smoother.reset()
+        self._init = False
@@ -32,40 +32,40 @@ class TestPinchDetector:
     
     def test_pinch_detected_when_distance_below_threshold(self, detector: PinchDetector):
         """Pinch should be detected when distance is below threshold."""
-        state = detector.update(0.03)  # Below threshold of 0.05
+        state = detector.update(0.03 ** 2)  # Below threshold of 0.05
         assert detector.is_pinched
         assert state == GestureState.TRIGGERED
     
     def test_no_pinch_when_distance_above_threshold(self, detector: PinchDetector):
         """No pinch when distance is above threshold."""
-        state = detector.update(0.10)  # Above threshold
+        state = detector.update(0.10 ** 2)  # Above threshold
         assert not detector.is_pinched
         assert state == GestureState.IDLE
     
     def test_state_transitions_to_released_on_release(self, detector: PinchDetector):
         """State should transition to RELEASED when pinch is released."""
         # Start pinch
-        detector.update(0.03)
+        detector.update(0.03 ** 2)
         assert detector.state == GestureState.TRIGGERED
         
         # Release
-        state = detector.update(0.10)
+        state = detector.update(0.10 ** 2)
         assert state == GestureState.RELEASED
     
     def test_holding_state_after_hold_time(self, detector: PinchDetector):
         """State should transition to HOLDING after hold time."""
         # Start pinch
-        detector.update(0.03)
+        detector.update(0.03 ** 2)
         
         # Wait and update again (simulating hold)
         time.sleep(0.15)  # Wait longer than hold_ms (100ms)
-        state = detector.update(0.03)
+        state = detector.update(0.03 ** 2)
         
         assert state == GestureState.HOLDING
     
     def test_reset_clears_state(self, detector: PinchDetector):
         """Reset should clear all state."""
-        detector.update(0.03)
+        detector.update(0.03 ** 2)
         detector.reset()
         
         assert detector.state == GestureState.IDLE